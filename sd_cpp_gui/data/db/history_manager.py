@@ -6,7 +6,16 @@ import csv
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from sd_cpp_gui.data.db.base_manager import ImportExportMixin
 from sd_cpp_gui.data.db.database import db
@@ -71,6 +80,27 @@ class HistoryManager(ImportExportMixin):
         query = HistoryEntry.select().order_by(HistoryEntry.timestamp.desc())
         return [self._entry_to_dict(entry) for entry in query]
 
+    def iter_chunks(self, size: int = 1000) -> Iterator[List[HistoryData]]:
+        """
+        Yields all history entries in chunks ordered by UUID, using keyset
+        pagination so only one chunk is held in memory at a time.
+
+        Args:
+                size: Maximum number of entries per chunk.
+        """
+        last_uuid: Optional[str] = None
+        while True:
+            query = HistoryEntry.select().order_by(HistoryEntry.uuid)
+            if last_uuid is not None:
+                query = query.where(HistoryEntry.uuid > last_uuid)
+            chunk = [self._entry_to_dict(e) for e in query.limit(size)]
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < size:
+                return
+            last_uuid = chunk[-1]["uuid"]
+
     def get(self, entry_uuid: str) -> Optional[HistoryData]:
         """
         Retrieves a single history entry by its UUID.
@@ -131,6 +161,42 @@ class HistoryManager(ImportExportMixin):
             query = query.where(HistoryEntry.prompt.contains(search_query))
         return query.count()
 
+    def bulk_update(
+        self,
+        updates: List[Tuple[str, Dict[str, str]]],
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Applies column updates to many entries using executemany, one
+        transaction per batch. Rows are grouped by the set of columns
+        they change so each group shares a single statement.
+
+        Args:
+                updates: (uuid, {column: value}) pairs.
+                batch_size: Rows per transaction.
+        """
+        groups: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+        for entry_uuid, fields in updates:
+            cols = tuple(sorted(fields))
+            groups.setdefault(cols, []).append(
+                tuple(fields[c] for c in cols) + (entry_uuid,)
+            )
+        meta = HistoryEntry._meta  # pylint: disable=protected-access
+        for cols, params in groups.items():
+            unknown = set(cols).difference(meta.columns)
+            if unknown:
+                raise ValueError(f"Unknown history columns: {unknown}")
+            sql = (
+                f'UPDATE "{meta.table_name}" SET '
+                + ", ".join(f'"{c}" = ?' for c in cols)
+                + ' WHERE "uuid" = ?'
+            )
+            for start in range(0, len(params), batch_size):
+                with db.atomic():
+                    db.cursor().executemany(
+                        sql, params[start : start + batch_size]
+                    )
+
     def get_used_model_ids(self) -> List[str]:
         """
         Returns a list of unique model IDs that have been used in the history.
@@ -7,7 +7,17 @@ import json
 import os
 import unicodedata
 import uuid
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    Union,
+)
 
 from peewee import fn
 
@@ -394,6 +404,17 @@ class _NetworkManagerBase(ImportExportMixin):
         query = self.model_class.select().order_by(self.model_class.alias.asc())  # type: ignore
         return [self._entry_to_dict(e) for e in query]
 
+    def get_all_slim(self, fields: Sequence[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Streams raw rows holding only the requested columns.
+        Values are returned as stored (no NetworkData defaults applied).
+
+        Logic: Selects the given columns as dicts without caching rows.
+        """
+        columns = [getattr(self.model_class, f) for f in fields]
+        query = self.model_class.select(*columns).dicts()
+        return query.iterator()
+
     def get_remote_index(self) -> Dict[str, str]:
         """
         Returns a map of {remote_version_id: local_path} for fast lookup.
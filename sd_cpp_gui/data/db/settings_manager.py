@@ -2,7 +2,7 @@
 Settings Manager
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from sd_cpp_gui.data.db.database import db
 from sd_cpp_gui.data.db.init_db import Database
@@ -31,6 +31,27 @@ class SettingsManager:
         setting = SettingModel.get_or_none(SettingModel.key == key)
         return setting.value if setting else default
 
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetches several raw setting values in one query.
+
+        Args:
+                keys: The setting keys to read.
+
+        Returns:
+                Mapping of key to stored value; missing keys are absent.
+
+        Logic: Selects all requested keys with a single IN query.
+        """
+        if not keys:
+            return {}
+        query = (
+            SettingModel.select(SettingModel.key, SettingModel.value)
+            .where(SettingModel.key.in_(list(keys)))
+            .tuples()
+        )
+        return dict(query)
+
     def get_app(self) -> str:
         """Returns the executable path.
 
@@ -36,6 +36,10 @@ class RemoteManager:
         self.downloader = DownloadManager()
         self.sidecar = SidecarService(settings_manager)
 
+    def close(self) -> None:
+        """Logic: Releases the sidecar service's pooled HTTP connections."""
+        self.sidecar.close()
+
     def get_repository(self, provider: str = "civitai") -> IRemoteRepository:
         """
         Returns the requested repository adapter, creating it if necessary.
@@ -5,11 +5,12 @@ parameters module exports.
 from .parser import CommandParser
 from .processors import ArgumentProcessor
 from .states import StateManager
-from .types import EmbeddingData, GenerationState, LoraData
+from .types import EmbeddingData, GenerationState, LoraData, LoraStore
 
 __all__ = [
     "GenerationState",
     "LoraData",
+    "LoraStore",
     "EmbeddingData",
     "StateManager",
     "ArgumentProcessor",
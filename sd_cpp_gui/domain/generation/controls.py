@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from sd_cpp_gui.domain.generation.commands_loader import CommandDefinition
 from sd_cpp_gui.ui.controls.base import BaseArgumentControl
@@ -75,7 +84,7 @@ def new_argument_control(
 
 
 def remove_control(
-    controls: Dict[str, Set[BaseArgumentControl]],
+    controls: Dict[str, List[BaseArgumentControl]],
     flag: str,
     control: BaseArgumentControl,
 ) -> None:
@@ -92,7 +101,7 @@ def remove_control(
 
 
 def cleanup_dead_controls(
-    controls: Dict[str, Set[BaseArgumentControl]],
+    controls: Dict[str, List[BaseArgumentControl]],
 ) -> None:
     """
     Iterates through the controls dict and removes references
@@ -101,17 +110,16 @@ def cleanup_dead_controls(
     Logic: Cleans up dead controls.
     """
     flags_to_remove: List[str] = []
-    for flag, control_set in controls.items():
-        dead_controls = {c for c in control_set if not c.winfo_exists()}
-        control_set.difference_update(dead_controls)
-        if not control_set:
+    for flag, control_list in controls.items():
+        control_list[:] = [c for c in control_list if c.winfo_exists()]
+        if not control_list:
             flags_to_remove.append(flag)
     for flag in flags_to_remove:
         del controls[flag]
 
 
 def set_overriden_controls(
-    controls: Dict[str, Set[BaseArgumentControl]],
+    controls: Dict[str, List[BaseArgumentControl]],
     overriders: Dict[str, BaseArgumentControl],
 ) -> None:
     """
@@ -150,7 +158,7 @@ def bind_control_callbacks(
 
 
 def get_control(
-    controls: Dict[str, Set[BaseArgumentControl]], flag: str
+    controls: Dict[str, List[BaseArgumentControl]], flag: str
 ) -> Optional[BaseArgumentControl]:
     """Gets a live control widget associated with a flag.
 
@@ -163,7 +171,7 @@ def get_control(
 
 
 def _apply_to_controls(
-    controls: Set[BaseArgumentControl],
+    controls: Iterable[BaseArgumentControl],
     action: Callable[[BaseArgumentControl], None],
 ) -> None:
     """Helper to iterate safely over controls and apply an action.
@@ -176,7 +184,7 @@ def _apply_to_controls(
             action(control)
 
 
-def set_value(controls: Set[BaseArgumentControl], value: Any) -> None:
+def set_value(controls: Iterable[BaseArgumentControl], value: Any) -> None:
     """Sets the value for all controls associated with a flag.
 
     Logic: Sets value on controls."""
@@ -190,7 +198,7 @@ def set_value(controls: Set[BaseArgumentControl], value: Any) -> None:
     _apply_to_controls(controls, _action)
 
 
-def set_enabled(controls: Set[BaseArgumentControl], enabled: bool) -> None:
+def set_enabled(controls: Iterable[BaseArgumentControl], enabled: bool) -> None:
     """Sets the enabled state for all controls associated with a flag.
 
     Logic: Sets enabled state on controls."""
@@ -203,13 +211,13 @@ def set_enabled(controls: Set[BaseArgumentControl], enabled: bool) -> None:
 
 
 def set_control_values(
-    controls: Set[BaseArgumentControl], value: Any, enabled: bool
+    controls: Iterable[BaseArgumentControl], value: Any, enabled: bool
 ) -> None:
     """
     Updates both the value and the enabled state for a set of controls.
 
     Args:
-            controls: Set of controls to update.
+            controls: Controls to update.
             value: The new value.
             enabled: The new enabled state.
     """
@@ -225,8 +233,44 @@ def set_control_values(
     _apply_to_controls(controls, _action)
 
 
+def consolidate_param(
+    controls: Iterable[BaseArgumentControl],
+) -> Optional[Tuple[bool, Any]]:
+    """
+    Reads the current state of the first live, non-overridden control
+    of a flag.
+
+    Returns:
+        (enabled, value), or None if no control is active.
+    """
+    for ctrl in controls:
+        if not ctrl.is_overridden and ctrl.winfo_exists():
+            return ctrl.var_enabled.get(), ctrl.var_value.get()
+    return None
+
+
+def iter_consolidated(
+    controls: Dict[str, List[BaseArgumentControl]],
+    flags: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[str, bool, Any]]:
+    """
+    Yields (flag, enabled, value) for each flag that has an active control.
+
+    Args:
+        controls: The dictionary of all registered controls.
+        flags: Restricts the walk to these flags; defaults to all of them.
+    """
+    for flag in controls if flags is None else flags:
+        control_list = controls.get(flag)
+        if not control_list:
+            continue
+        res = consolidate_param(control_list)
+        if res is not None:
+            yield flag, res[0], res[1]
+
+
 def consolidate_params(
-    controls: Dict[str, Set[BaseArgumentControl]],
+    controls: Dict[str, List[BaseArgumentControl]],
 ) -> Dict[str, Any]:
     """
     Aggregates the current state (value and enabled) from all active
@@ -236,13 +280,7 @@ def consolidate_params(
         A dictionary mapping flags to their current UI state:
         {'--flag': {'enabled': bool, 'value': Any}, ...}
     """
-    params = {}
-    for flag, control_set in controls.items():
-        for ctrl in control_set:
-            if not ctrl.is_overridden and ctrl.winfo_exists():
-                params[flag] = {
-                    "enabled": ctrl.var_enabled.get(),
-                    "value": ctrl.var_value.get(),
-                }
-                break
-    return params
+    return {
+        flag: {"enabled": enabled, "value": value}
+        for flag, enabled, value in iter_consolidated(controls)
+    }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from dataclasses import replace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -193,13 +194,14 @@ class ArgumentProcessor:
         lora_dirs: Set[str] = set()
         triggers_list: List[str] = []
         lora_tags_list: List[str] = []
-        should_add_trigger = state.add_triggers.get("lora", False)
-        for name, data in state.loras.items():
-            if data.triggers and should_add_trigger:
-                triggers_list.append(data.triggers)
-            lora_tags_list.append(f"<lora:{name}:{data.strength}>")
-            if data.dir_path:
-                lora_dirs.add(data.dir_path)
+        loras = state.loras
+        if state.add_triggers.get("lora", False):
+            triggers_list.extend(t for t in loras.triggers.values() if t)
+        lora_tags_list.extend(
+            f"<lora:{name}:{strength}>"
+            for name, strength in loras.strength.items()
+        )
+        lora_dirs.update(d for d in loras.dir_path.values() if d)
         parts = []
         if prompt:
             parts.append(prompt)
@@ -293,7 +295,6 @@ class ArgumentProcessor:
             prompt="",
             negative_prompt="",
             parameters={},
-            loras={},
             embeddings={},
         )
         raw_neg_prompt = ""
@@ -398,17 +399,21 @@ class ArgumentProcessor:
                 match = manager.find_best_match(content_hash, remote_id, name)
                 if match:
                     current_name = match["name"] or match["alias"]
-                    data.dir_path = match["dir_path"]
-                    data.triggers = match["trigger_words"]
-                    data.content_hash = match["content_hash"]
-                    data.remote_version_id = match["remote_version_id"]
-                    data.original_name = name
-                    state.embeddings[current_name] = data
+                    state.embeddings[current_name] = replace(
+                        data,
+                        dir_path=match["dir_path"],
+                        triggers=match["trigger_words"],
+                        content_hash=match["content_hash"],
+                        remote_version_id=match["remote_version_id"],
+                        original_name=name,
+                    )
                 else:
-                    data.content_hash = content_hash
-                    data.remote_version_id = remote_id
-                    data.original_name = name
-                    state.embeddings[name] = data
+                    state.embeddings[name] = replace(
+                        data,
+                        content_hash=content_hash,
+                        remote_version_id=remote_id,
+                        original_name=name,
+                    )
 
         process_hints(pos_hints)
         process_hints(neg_hints)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import tkinter as tk
-from contextlib import contextmanager
+from functools import partial
+from operator import itemgetter
 from typing import (
     Any,
     Callable,
     Dict,
-    Generator,
+    FrozenSet,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -29,12 +31,65 @@ from sd_cpp_gui.ui.controls.base import BaseArgumentControl
 
 ListenerCallback = Callable[[str, str, Any], None]
 
+_MISSING = object()
+
+_KIND_NORMAL = 0
+_KIND_PROMPT = 1
+_KIND_NEG_PROMPT = 2
+_KIND_EXCLUDED = 3
+
+
+class _ProgrammaticUpdate:
+    """
+    Reusable, re-entrant context object behind
+    StateManager.programmatic_update(). Tracks nesting depth so a single
+    instance can be shared by all (nested) with-blocks.
+    """
+
+    __slots__ = ("mgr", "depth")
+
+    def __init__(self, mgr: StateManager) -> None:
+        self.mgr = mgr
+        self.depth = 0
+
+    def __enter__(self) -> None:
+        self.depth += 1
+        self.mgr._is_programmatic_update = True
+
+    def __exit__(self, *_: Any) -> None:
+        if self.depth == 1:
+            try:
+                self.mgr._flush_pending_events()
+            finally:
+                self.depth = 0
+                self.mgr._is_programmatic_update = False
+        else:
+            self.depth -= 1
+
 
 class StateManager:
     """
     A unified controller that manages Data Logic, View Logic and Sync.
     """
 
+    __slots__ = (
+        "cmd_loader",
+        "state",
+        "arg_processor",
+        "controls",
+        "_is_programmatic_update",
+        "_prog_ctx",
+        "_listeners",
+        "_listeners_all",
+        "_pending_events",
+        "_prompt_flag",
+        "_neg_prompt_flag",
+        "_persistent_flags",
+        "_non_persistent_flags",
+        "_dirty_flags",
+        "_flag_kind",
+    )
+
     def __init__(
         self,
         cmd_loader: CommandLoader,
@@ -45,11 +100,67 @@ class StateManager:
         self.cmd_loader = cmd_loader
         self.state = generation_state
         self.arg_processor = arg_processor
-        self.controls: Dict[str, Set[BaseArgumentControl]] = {}
+        self.controls: Dict[str, List[BaseArgumentControl]] = {}
         self._is_programmatic_update = False
-        self._listeners: List[ListenerCallback] = []
+        self._prog_ctx = _ProgrammaticUpdate(self)
+        self._listeners: Dict[str, List[ListenerCallback]] = {}
+        self._listeners_all: List[ListenerCallback] = []
+        self._pending_events: Dict[Tuple[str, str], Any] = {}
+        self._prompt_flag = ""
+        self._neg_prompt_flag = ""
+        self._persistent_flags: Optional[FrozenSet[str]] = None
+        self._non_persistent_flags: Set[str] = set()
+        self._dirty_flags: Set[str] = set()
+        self._flag_kind: Dict[str, int] = {}
+        self.refresh_flag_cache()
         self.state.add_triggers = {"lora": False, "embedding": False}
 
+    def refresh_flag_cache(self) -> None:
+        """
+        Recomputes flag lookups derived from the command definitions.
+        Must be called if the command loader contents change.
+
+        Logic: Caches prompt flags, persistent flags and flag kinds.
+        """
+        self._prompt_flag = self._get_flag_by_internal_name("Prompt")
+        self._neg_prompt_flag = self._get_flag_by_internal_name(
+            "Negative Prompt"
+        )
+        self._persistent_flags = None
+        persistent = self._get_persistent_flags_cached()
+        self._non_persistent_flags = {
+            flag for flag in self.controls if flag not in persistent
+        }
+        self._flag_kind = {}
+        for flag in self.cmd_loader.get_all_flags():
+            self._flag_kind[flag] = self._classify_flag(flag)
+
+    def _classify_flag(self, flag: str) -> int:
+        """Logic: Maps a flag to its _KIND_* classification."""
+        ap = self.arg_processor
+        if ap.is_prompt_flag(flag):
+            return _KIND_PROMPT
+        if ap.is_negative_prompt_flag(flag):
+            return _KIND_NEG_PROMPT
+        if ap.is_excluded(flag):
+            return _KIND_EXCLUDED
+        return _KIND_NORMAL
+
+    def _get_flag_kind(self, flag: str) -> int:
+        """Logic: Returns the cached classification, filling it on a miss."""
+        kind = self._flag_kind.get(flag)
+        if kind is None:
+            kind = self._flag_kind[flag] = self._classify_flag(flag)
+        return kind
+
+    def _get_persistent_flags_cached(self) -> FrozenSet[str]:
+        """Logic: Returns memoized persistent flags."""
+        if self._persistent_flags is None:
+            self._persistent_flags = frozenset(
+                self.arg_processor.get_persistent_flags()
+            )
+        return self._persistent_flags
+
     def append_triggers(
         self, name: Literal["lora", "embedding"], value: bool
     ) -> None:
@@ -63,29 +174,75 @@ class StateManager:
         """
         self.state.add_triggers[name] = value
 
-    def add_listener(self, callback: ListenerCallback) -> None:
+    def add_listener(
+        self,
+        callback: ListenerCallback,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> None:
         """Adds a callback to be notified on state changes.
 
+        Args:
+            callback: Called as callback(event_type, key, value).
+            event_types: If given, the callback only receives these event
+                types; otherwise it receives every event.
+
         Logic: Adds listener."""
-        if callback not in self._listeners:
-            self._listeners.append(callback)
+        if event_types is None:
+            if callback not in self._listeners_all:
+                self._listeners_all.append(callback)
+            return
+        for event_type in event_types:
+            subscribers = self._listeners.setdefault(event_type, [])
+            if callback not in subscribers:
+                subscribers.append(callback)
 
     def remove_listener(self, callback: ListenerCallback) -> None:
-        """Removes a listener callback.
+        """Removes a listener callback from every event type.
 
         Logic: Removes listener."""
-        if callback in self._listeners:
-            self._listeners.remove(callback)
+        if callback in self._listeners_all:
+            self._listeners_all.remove(callback)
+        for subscribers in self._listeners.values():
+            if callback in subscribers:
+                subscribers.remove(callback)
 
     def _notify(self, event_type: str, key: str, value: Any = None) -> None:
         """
         Notifies all listeners of a state change.
         event_type: 'parameter', 'lora', 'embedding', 'prompt', 'reset'
 
-        Logic: Notifies listeners.
+        During a programmatic update, events are buffered and coalesced by
+        (event_type, key), keeping the last value; they are dispatched once
+        when the outermost programmatic_update() exits.
+
+        Logic: Notifies listeners or buffers the event.
         """
-        for listener in self._listeners:
+        if self._is_programmatic_update:
+            event_key = (event_type, key)
+            self._pending_events.pop(event_key, None)
+            self._pending_events[event_key] = value
+            return
+        self._dispatch(event_type, key, value)
+
+    def _dispatch(self, event_type: str, key: str, value: Any) -> None:
+        """Logic: Invokes listeners subscribed to the event type."""
+        for listener in self._listeners.get(event_type, ()):
             listener(event_type, key, value)
+        for listener in self._listeners_all:
+            listener(event_type, key, value)
+
+    def _flush_pending_events(self) -> None:
+        """
+        Dispatches buffered events. Listeners may emit further events while
+        being notified, so the buffer is drained until empty.
+
+        Logic: Drains coalesced events.
+        """
+        while self._pending_events:
+            pending = self._pending_events
+            self._pending_events = {}
+            for (event_type, key), value in pending.items():
+                self._dispatch(event_type, key, value)
 
     def update_prompt(self, attr_name: str, value: str) -> None:
         """
@@ -112,18 +269,17 @@ class StateManager:
         Returns:
             True if the state was actually changed.
         """
-        changed = False
-        current_val = self.state.parameters.get(flag)
+        params = self.state.parameters
         if enabled:
-            if current_val != value:
-                self.state.parameters[flag] = value
-                changed = True
+            if params.get(flag) != value:
+                params[flag] = value
                 self._notify("parameter", flag, value)
-        elif flag in self.state.parameters:
-            del self.state.parameters[flag]
-            changed = True
+                return True
+            return False
+        if params.pop(flag, _MISSING) is not _MISSING:
             self._notify("parameter", flag, None)
-        return changed
+            return True
+        return False
 
     def configure_state_for_model(
         self, model_data: Optional[Dict[str, Any]]
@@ -136,7 +292,8 @@ class StateManager:
 
         Returns:
                 A list of (flag, value, enabled) tuples representing the new
-                configuration for the UI.
+                configuration for the UI, sorted by flag (the dynamic
+                parameter panel is laid out in this order).
         """
         defaults = (
             self.arg_processor.get_model_defaults(model_data)
@@ -148,33 +305,36 @@ class StateManager:
             self.state.parameters.clear()
             self.state.loras.clear()
             self.state.embeddings.clear()
-            self.cleanup_controls()
-            reset_flags = set(self.controls.keys()).difference(
-                self.arg_processor.get_persistent_flags()
-            )
-            for flag in reset_flags:
-                self.set_enabled(flag, False)
+            self.set_enabled_many(self._non_persistent_flags, False)
             self._notify("reset", "all", {"keep_networks": False})
+            get_kind = self._get_flag_kind
+            upd_param = self.update_parameter
+            upd_prompt = self.update_prompt
+            get_ctrl = self.get_control
+            set_vals = self.set_control_values
+            add_active = active_config.append
             for param in defaults:
                 flag = param["flag"]
                 value = param["value"]
                 enabled = param.get("enabled", True)
-                if self.arg_processor.is_prompt_flag(flag):
-                    self.update_prompt("prompt", str(value))
-                    continue
-                if self.arg_processor.is_negative_prompt_flag(flag):
-                    self.update_prompt("negative_prompt", str(value))
+                kind = get_kind(flag)
+                if kind != _KIND_NORMAL:
+                    if kind == _KIND_PROMPT:
+                        upd_prompt("prompt", str(value))
+                    elif kind == _KIND_NEG_PROMPT:
+                        upd_prompt("negative_prompt", str(value))
                     continue
-                if self.arg_processor.is_excluded(flag):
-                    continue
-                self.update_parameter(flag, value, enabled)
-                ctrl = self.get_control(flag)
+                upd_param(flag, value, enabled)
+                ctrl = get_ctrl(flag)
                 if ctrl:
                     ctrl.set_override_mode(True)
-                    self.set_control_values(flag, value, enabled)
-                active_config.append((flag, value, enabled))
-        self.sync_all_controls()
-        return sorted(active_config, key=lambda x: x[0])
+                    set_vals(flag, value, enabled)
+                add_active((flag, value, enabled))
+        # parameters were cleared above, so persistent controls (which are
+        # not dirty) must be read back too
+        self.sync_all_controls(force=True)
+        active_config.sort(key=itemgetter(0))
+        return active_config
 
     def restore_state(self, restored_state: GenerationState) -> None:
         """
@@ -185,22 +345,24 @@ class StateManager:
         Logic: Replaces current state with restored state and updates UI.
         """
         with self.programmatic_update():
-            reset_flags = set(self.controls.keys()).difference(
-                self.arg_processor.get_persistent_flags()
-            )
-            for flag in reset_flags:
-                self.set_enabled(flag, False)
+            self.set_enabled_many(self._non_persistent_flags, False)
+            upd_param = self.update_parameter
             for flag, value in restored_state.parameters.items():
-                self.update_parameter(flag, value, enabled=True)
-                self.set_control_values(flag, value, enabled=True)
+                upd_param(flag, value, True)
+            self.set_control_values_many(
+                (flag, value, True)
+                for flag, value in restored_state.parameters.items()
+            )
             self.update_prompt("prompt", restored_state.prompt)
             self.update_prompt(
                 "negative_prompt", restored_state.negative_prompt
             )
             self.state.loras.clear()
             self.state.embeddings.clear()
+            upd_lora = self.update_lora
+            upd_emb = self.update_embedding
             for name, data in restored_state.loras.items():
-                self.update_lora(
+                upd_lora(
                     name,
                     data.strength,
                     data.dir_path,
@@ -211,7 +373,7 @@ class StateManager:
                     original_name=data.original_name,
                 )
             for name, data in restored_state.embeddings.items():
-                self.update_embedding(
+                upd_emb(
                     name,
                     data.target,
                     data.strength,
@@ -223,23 +385,26 @@ class StateManager:
                     original_name=data.original_name,
                 )
 
-    def sync_all_controls(self):
+    def sync_all_controls(self, force: bool = False) -> None:
         """
-        Forces a synchronization of the internal state parameters from the
-        current values held by all registered UI controls.
+        Synchronizes the internal state parameters from the values held by
+        the UI controls.
+
+        Only flags whose controls changed while callbacks were suppressed
+        (or that were newly registered) are read, unless force is True,
+        in which case every registered control is walked.
         """
-        res = controls.consolidate_params(self.controls)
-        for flag, data in res.items():
-            enabled = data["enabled"]
-            value = data["value"]
+        flags = None if force else self._dirty_flags
+        self._dirty_flags = set()
+        params = self.state.parameters
+        for flag, enabled, value in controls.iter_consolidated(
+            self.controls, flags
+        ):
             if enabled:
-                if (
-                    flag not in self.state.parameters
-                    or self.state.parameters[flag] != value
-                ):
-                    self.state.parameters[flag] = value
-            elif flag in self.state.parameters:
-                del self.state.parameters[flag]
+                if params.get(flag, _MISSING) != value:
+                    params[flag] = value
+            else:
+                params.pop(flag, None)
 
     def update_lora(
         self,
@@ -268,6 +433,17 @@ class StateManager:
         """
         changed = False
         if enabled:
+            loras = self.state.loras
+            if (
+                name in loras
+                and loras.strength[name] == strength
+                and loras.dir_path[name] == dir_path
+                and loras.triggers[name] == triggers
+                and loras.content_hash[name] == content_hash
+                and loras.remote_version_id[name] == remote_version_id
+                and loras.original_name[name] == original_name
+            ):
+                return False
             new_data = LoraData(
                 strength,
                 dir_path,
@@ -276,11 +452,9 @@ class StateManager:
                 remote_version_id,
                 original_name,
             )
-            current_data = self.state.loras.get(name)
-            if current_data != new_data:
-                self.state.loras[name] = new_data
-                changed = True
-                self._notify("lora", name, new_data)
+            self.state.loras[name] = new_data
+            changed = True
+            self._notify("lora", name, new_data)
         elif name in self.state.loras:
             del self.state.loras[name]
             changed = True
@@ -315,6 +489,18 @@ class StateManager:
         """
         changed = False
         if enabled:
+            current = self.state.embeddings.get(name)
+            if (
+                current is not None
+                and current.target == target
+                and current.strength == strength
+                and current.dir_path == dir_path
+                and current.triggers == triggers
+                and current.content_hash == content_hash
+                and current.remote_version_id == remote_version_id
+                and current.original_name == original_name
+            ):
+                return False
             new_data = EmbeddingData(
                 target,
                 strength,
@@ -324,28 +510,22 @@ class StateManager:
                 remote_version_id,
                 original_name,
             )
-            current_data = self.state.embeddings.get(name)
-            if current_data != new_data:
-                self.state.embeddings[name] = new_data
-                changed = True
-                self._notify("embedding", name, new_data)
+            self.state.embeddings[name] = new_data
+            changed = True
+            self._notify("embedding", name, new_data)
         elif name in self.state.embeddings:
             del self.state.embeddings[name]
             changed = True
             self._notify("embedding", name, None)
         return changed
 
-    @contextmanager
-    def programmatic_update(self) -> Generator[None, None, None]:
+    def programmatic_update(self) -> _ProgrammaticUpdate:
         """Context manager to suppress UI callbacks during bulk updates.
+        State events raised inside the block are coalesced and flushed
+        when the outermost block exits.
 
-        Logic: Sets programmatic flag during context."""
-        previous = self._is_programmatic_update
-        self._is_programmatic_update = True
-        try:
-            yield
-        finally:
-            self._is_programmatic_update = previous
+        Logic: Returns the shared programmatic-update context."""
+        return self._prog_ctx
 
     def get_control(self, flag: str) -> Optional[BaseArgumentControl]:
         """Logic: Gets control for flag."""
@@ -358,14 +538,22 @@ class StateManager:
         Logic: Sets control value.
         """
         with self.programmatic_update():
-            controls.set_value(self.controls.get(flag, set()), value)
+            controls.set_value(self.controls.get(flag, ()), value)
 
     def set_enabled(self, flag: str, enabled: bool) -> None:
         """Sets the enabled state for UI controls.
 
         Logic: Sets control enabled state."""
         with self.programmatic_update():
-            controls.set_enabled(self.controls.get(flag, set()), enabled)
+            controls.set_enabled(self.controls.get(flag, ()), enabled)
+
+    def set_enabled_many(self, flags: Iterable[str], enabled: bool) -> None:
+        """Sets the enabled state for the UI controls of several flags.
+
+        Logic: Sets control enabled state in a single programmatic block."""
+        with self.programmatic_update():
+            for flag in flags:
+                controls.set_enabled(self.controls.get(flag, ()), enabled)
 
     def set_control_values(self, flag: str, value: Any, enabled: bool) -> None:
         """Sets the value for UI controls.
@@ -373,16 +561,38 @@ class StateManager:
         Logic: Sets control values and state."""
         with self.programmatic_update():
             controls.set_control_values(
-                self.controls.get(flag, set()), value, enabled
+                self.controls.get(flag, ()), value, enabled
             )
 
+    def set_control_values_many(
+        self, entries: Iterable[Tuple[str, Any, bool]]
+    ) -> None:
+        """Sets value and enabled state for the UI controls of several flags.
+
+        Args:
+            entries: (flag, value, enabled) tuples.
+
+        Logic: Sets control values in a single programmatic block."""
+        with self.programmatic_update():
+            for flag, value, enabled in entries:
+                controls.set_control_values(
+                    self.controls.get(flag, ()), value, enabled
+                )
+
     def remove_control(self, flag: str, control: BaseArgumentControl) -> None:
         """Logic: Removes control reference."""
         controls.remove_control(self.controls, flag, control)
+        if flag not in self.controls:
+            self._non_persistent_flags.discard(flag)
 
     def cleanup_controls(self) -> None:
-        """Logic: Removes destroyed controls."""
+        """
+        Removes destroyed controls. Controls unregister themselves on
+        <Destroy>, so this is only a safety net.
+
+        Logic: Removes destroyed controls."""
         controls.cleanup_dead_controls(self.controls)
+        self._non_persistent_flags.intersection_update(self.controls)
 
     def set_overriden_controls(
         self, overriders: Dict[str, BaseArgumentControl]
@@ -398,48 +608,73 @@ class StateManager:
 
         Logic: Registers control and binds callbacks.
         """
-        if flag not in self.controls:
-            self.controls[flag] = set()
+        existing = self.controls.get(flag)
+        if existing is None:
+            existing = []
+            self.controls[flag] = existing
+            if flag not in self._get_persistent_flags_cached():
+                self._non_persistent_flags.add(flag)
         elif unique:
             return False
-        self.controls[flag].add(control)
+        if control not in existing:
+            existing.append(control)
+            control.bind(
+                "<Destroy>",
+                partial(self._on_control_destroyed, flag, control),
+                add="+",
+            )
+        self._dirty_flags.add(flag)
+
+        kind = "standard"
+        if flag == self._prompt_flag:
+            kind = "prompt"
+        elif flag == self._neg_prompt_flag:
+            kind = "negative_prompt"
+        callback_fn = partial(self._on_control_event, control, flag, kind)
+        controls.bind_control_callbacks(
+            control=control,
+            on_value_change=callback_fn,
+            on_enabled_change=callback_fn,
+        )
+        return True
+
+    def _on_control_event(
+        self,
+        control: BaseArgumentControl,
+        flag: str,
+        kind: str,
+        *_: Any,
+    ) -> None:
+        """
+        Shared trace callback for registered controls. `kind` is 'prompt' or
+        'negative_prompt' for the prompt controls, 'standard' otherwise.
 
-        def _standard_update(*_: Any) -> None:
-            if control.is_overridden or self._is_programmatic_update:
-                return
+        Logic: Pushes control value/enabled changes into the state.
+        """
+        if control.is_overridden or self._is_programmatic_update:
+            if kind == "standard":
+                self._dirty_flags.add(flag)
+            return
+        if kind == "standard":
             try:
                 enabled = control.var_enabled.get()
                 value = control.var_value.get() if enabled else None
                 self.update_parameter(flag, value, enabled)
             except (tk.TclError, ValueError):
                 pass
+            return
+        val = str(control.var_value.get()) if control.var_enabled.get() else ""
+        self.update_prompt(kind, val)
 
-        def _create_attr_updater(attr_name: str) -> Callable[..., None]:
-            def _update(*_: Any) -> None:
-                if control.is_overridden or self._is_programmatic_update:
-                    return
-                val = (
-                    str(control.var_value.get())
-                    if control.var_enabled.get()
-                    else ""
-                )
-                self.update_prompt(attr_name, val)
-
-            return _update
-
-        prompt_flag = self._get_flag_by_internal_name("Prompt")
-        neg_prompt_flag = self._get_flag_by_internal_name("Negative Prompt")
-        callback_fn = _standard_update
-        if flag == prompt_flag:
-            callback_fn = _create_attr_updater("prompt")
-        elif flag == neg_prompt_flag:
-            callback_fn = _create_attr_updater("negative_prompt")
-        controls.bind_control_callbacks(
-            control=control,
-            on_value_change=callback_fn,
-            on_enabled_change=callback_fn,
-        )
-        return True
+    def _on_control_destroyed(
+        self, flag: str, control: BaseArgumentControl, event: tk.Event
+    ) -> None:
+        """
+        Unregisters a control as soon as its widget is destroyed.
+        Callback: <Destroy>
+        """
+        if event.widget is control:
+            self.remove_control(flag, control)
 
     def _get_flag_by_internal_name(self, name: str) -> str:
         """Logic: Gets flag by internal name."""
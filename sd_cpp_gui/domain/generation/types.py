@@ -1,8 +1,10 @@
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoraData:
     """Data structure for a single LoRA configuration."""
 
@@ -14,7 +16,81 @@ class LoraData:
     original_name: Optional[str] = None
 
 
-@dataclass
+class LoraStore(MutableMapping[str, LoraData]):
+    """
+    Mapping of LoRA name -> LoraData stored field-by-field (one dict per
+    field). Consumers that only need one field can iterate that dict
+    directly; LoraData objects are rebuilt on access for everything else.
+    All field dicts share the same key order.
+    """
+
+    __slots__ = (
+        "strength",
+        "dir_path",
+        "triggers",
+        "content_hash",
+        "remote_version_id",
+        "original_name",
+    )
+
+    def __init__(self, initial: Optional[Mapping[str, LoraData]] = None):
+        self.strength: Dict[str, float] = {}
+        self.dir_path: Dict[str, str] = {}
+        self.triggers: Dict[str, Optional[str]] = {}
+        self.content_hash: Dict[str, Optional[str]] = {}
+        self.remote_version_id: Dict[str, Optional[str]] = {}
+        self.original_name: Dict[str, Optional[str]] = {}
+        if initial:
+            self.update(initial)
+
+    def __getitem__(self, name: str) -> LoraData:
+        return LoraData(
+            self.strength[name],
+            self.dir_path[name],
+            self.triggers[name],
+            self.content_hash[name],
+            self.remote_version_id[name],
+            self.original_name[name],
+        )
+
+    def __setitem__(self, name: str, data: LoraData) -> None:
+        self.strength[name] = data.strength
+        self.dir_path[name] = data.dir_path
+        self.triggers[name] = data.triggers
+        self.content_hash[name] = data.content_hash
+        self.remote_version_id[name] = data.remote_version_id
+        self.original_name[name] = data.original_name
+
+    def __delitem__(self, name: str) -> None:
+        del self.strength[name]
+        del self.dir_path[name]
+        del self.triggers[name]
+        del self.content_hash[name]
+        del self.remote_version_id[name]
+        del self.original_name[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.strength
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strength)
+
+    def __len__(self) -> int:
+        return len(self.strength)
+
+    def clear(self) -> None:
+        self.strength.clear()
+        self.dir_path.clear()
+        self.triggers.clear()
+        self.content_hash.clear()
+        self.remote_version_id.clear()
+        self.original_name.clear()
+
+    def __repr__(self) -> str:
+        return f"LoraStore({dict(self.items())!r})"
+
+
+@dataclass(frozen=True, slots=True)
 class EmbeddingData:
     """Data structure for a single Embedding configuration."""
 
@@ -39,22 +115,37 @@ class GenerationState:
     negative_prompt: str = ""
     add_triggers: Dict[str, bool] = field(default_factory=dict)
     parameters: Dict[str, Any] = field(default_factory=dict)
-    loras: Dict[str, LoraData] = field(default_factory=dict)
+    loras: LoraStore = field(default_factory=LoraStore)
     embeddings: Dict[str, EmbeddingData] = field(default_factory=dict)
 
-    def get_full_state(self) -> Dict[str, Any]:
+    def __post_init__(self) -> None:
+        if not isinstance(self.loras, LoraStore):
+            self.loras = LoraStore(self.loras)
+
+    def get_full_state(self, copy: bool = False) -> Dict[str, Any]:
         """Returns a dictionary representation for legacy compatibility.
 
+        By default "parameters" is a read-only live view of the state;
+        pass copy=True to get an independent snapshot instead.
+
         Logic: Serializes state to dictionary."""
         return {
             "model_id": self.model_id,
             "prompt": self.prompt,
             "negative_prompt": self.negative_prompt,
             "add_triggers": self.add_triggers,
-            "parameters": self.parameters.copy(),
+            "parameters": (
+                self.parameters.copy()
+                if copy
+                else MappingProxyType(self.parameters)
+            ),
             "loras": {
-                k: (v.strength, v.dir_path, v.triggers)
-                for k, v in self.loras.items()
+                k: (strength, dir_path, triggers)
+                for (k, strength), dir_path, triggers in zip(
+                    self.loras.strength.items(),
+                    self.loras.dir_path.values(),
+                    self.loras.triggers.values(),
+                )
             },
             "embeddings": {
                 k: (v.target, v.strength, v.dir_path, v.triggers)
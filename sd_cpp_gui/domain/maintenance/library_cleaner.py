@@ -5,22 +5,84 @@ Service to orchestrate Library Sanitization and History Migration.
 import json
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
 
 from sd_cpp_gui.data.db.data_manager import (
     EmbeddingManager,
     HistoryManager,
     LoraManager,
 )
+from sd_cpp_gui.data.db.models import HistoryData
 from sd_cpp_gui.domain.utils.sanitization import (
+    fold_filename,
     get_unique_filename,
     make_filename_portable,
 )
+from sd_cpp_gui.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Try importing the faster third-party regex engine
+try:
+    import regex
+
+    REGEX_AVAILABLE = True
+except ImportError:
+    REGEX_AVAILABLE = False
+
+# Library basenames repeat across scans; memoize the NFKD/regex work
+_portable_filename = lru_cache(maxsize=8192)(make_filename_portable)
+
+# (manager, change record, column values) queued for a DB write
+_PendingRename = Tuple[Any, Dict[str, Any], Dict[str, str]]
+
+
+@lru_cache(maxsize=32)
+def _compile_rename_pattern(old_names: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Builds the combined history-rename pattern for a set of old names.
+    Group 1 matches the name inside a <lora:NAME: tag, group 2 a bare
+    word-bounded name. Cached so repeated runs reuse the compiled pattern.
+    Uses the `regex` module when installed, falling back to `re`.
+    """
+    engine: Any = regex if REGEX_AVAILABLE else re
+    # Longest names first so an alternation never stops on a prefix.
+    names = "|".join(
+        engine.escape(old) for old in sorted(old_names, key=len, reverse=True)
+    )
+    return engine.compile(
+        f"<lora:({names}):|(?<!\\w)({names})(?!\\w)", engine.IGNORECASE
+    )
 
 
 class LibraryCleanerService:
     # Regex to capture <lora:NAME:STRENGTH>
     _LORA_PATTERN = re.compile(r"<lora:([^:]+):([+-]?\d*\.?\d+)>")
+    # Columns fix_absent_loras needs from the LoRA table
+    _LORA_CACHE_FIELDS = (
+        "name",
+        "alias",
+        "content_hash",
+        "remote_version_id",
+        "trigger_words",
+    )
+    # Rows per history write transaction
+    _UPDATE_BATCH_SIZE = 500
+    # Directories renamed concurrently
+    _RENAME_WORKERS = 4
 
     def __init__(self) -> None:
         """Logic: Initializes managers."""
@@ -28,6 +90,11 @@ class LibraryCleanerService:
         self.embeddings = EmbeddingManager()
         self.history = HistoryManager()
 
+    def _iter_history(self) -> Iterator[HistoryData]:
+        """Logic: Streams history entries chunk by chunk."""
+        for chunk in self.history.iter_chunks():
+            yield from chunk
+
     def scan_for_changes(self) -> List[Dict[str, Any]]:
         """
         Scans all networks and identifies ones needing renaming.
@@ -37,20 +104,30 @@ class LibraryCleanerService:
         sanitized version.
         """
         changes: List[Dict[str, Any]] = []
+        # One directory listing per folder instead of one stat per row
+        names_by_dir: Dict[str, Set[str]] = {}
 
         def _process(manager: Any, type_label: str) -> None:
             for item in manager.get_all():
                 current_path = item.get("path", "")
-                if not current_path or not os.path.exists(current_path):
+                if not current_path:
+                    continue
+                dir_path, real_fname = os.path.split(
+                    os.path.abspath(current_path)
+                )
+                present = names_by_dir.get(dir_path)
+                if present is None:
+                    present = names_by_dir[dir_path] = self._list_dir(dir_path)
+                if fold_filename(real_fname) not in present:
                     continue
-                real_fname = os.path.basename(current_path)
-                new_fname = make_filename_portable(real_fname)
+                new_fname = _portable_filename(real_fname)
                 if real_fname != new_fname:
                     changes.append(
                         {
                             "type": type_label,
                             "id": item["id"],
                             "current_path": current_path,
+                            "dir_path": dir_path,
                             "current_name": item["name"],
                             "original_filename": real_fname,
                             "new_filename": new_fname,
@@ -70,64 +147,212 @@ class LibraryCleanerService:
         Returns a map of {OldInternalName: NewInternalName}
         for history patching.
 
-        Logic: Renames files, sidecars, and updates DB records.
+        Logic: Renames files and sidecars in parallel per directory, then
+        updates DB records from the calling thread.
         """
         name_map: Dict[str, str] = {}
+        pending: List[_PendingRename] = []
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for change in changes:
+            dir_path = change.get("dir_path") or os.path.dirname(
+                os.path.abspath(change["current_path"])
+            )
+            groups.setdefault(dir_path, []).append(change)
         total = len(changes)
-        for i, change in enumerate(changes):
-            if callback:
-                callback(i, total, f"Renaming {change['original_filename']}...")
+        done = 0
+        if callback:
+            callback(0, total, "Renaming files...")
+        # Renames in different directories never conflict; SQLite writes
+        # stay on this thread.
+        workers = max(1, min(self._RENAME_WORKERS, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._rename_group, dir_path, group)
+                for dir_path, group in groups.items()
+            ]
+            for future in as_completed(futures):
+                for change, fields in future.result():
+                    done += 1
+                    if fields is None:
+                        continue
+                    manager = (
+                        self.loras
+                        if change["type"] == "LoRA"
+                        else self.embeddings
+                    )
+                    pending.append((manager, change, fields))
+                    if len(pending) >= self._UPDATE_BATCH_SIZE:
+                        self._flush_renames(pending, name_map)
+                if callback:
+                    callback(done, total, f"Renamed {done}/{total} files...")
+        self._flush_renames(pending, name_map)
+        failed = [c for c in changes if c["status"].startswith("Error")]
+        if failed:
+            logger.warning(
+                "%d of %d renames failed (first: %s: %s)",
+                len(failed),
+                total,
+                failed[0]["original_filename"],
+                failed[0]["status"],
+            )
+        return name_map
+
+    def _rename_group(
+        self, dir_path: str, group: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Optional[Dict[str, str]]]]:
+        """
+        Renames the files of one directory sequentially.
+        Returns (change, column values) pairs; values are None on failure.
+
+        Logic: Renames each file and its sidecars against a shared
+        directory snapshot, recording the status on the change.
+        """
+        results: List[Tuple[Dict[str, Any], Optional[Dict[str, str]]]] = []
+        names_set: Optional[Set[str]] = None
+        for change in group:
+            fields: Optional[Dict[str, str]] = None
             try:
                 old_path = change["current_path"]
-                if not os.path.exists(old_path):
-                    change["status"] = "File Missing"
-                    continue
-                dir_path = os.path.dirname(os.path.abspath(old_path))
                 target_filename = change["new_filename"]
-                final_filename = get_unique_filename(dir_path, target_filename)
-                new_path = os.path.join(dir_path, final_filename)
-                if (
-                    old_path.lower() == new_path.lower()
-                    and old_path != new_path
-                ):
-                    temp_path = old_path + ".tmp"
-                    os.rename(old_path, temp_path)
-                    os.rename(temp_path, new_path)
-                else:
-                    os.rename(old_path, new_path)
-                self._handle_sidecars(old_path, new_path, final_filename)
-                new_stem = os.path.splitext(final_filename)[0]
-                manager = (
-                    self.loras if change["type"] == "LoRA" else self.embeddings
+                if names_set is None:
+                    names_set = self._list_dir(dir_path)
+                old_name = os.path.basename(old_path)
+                old_key = fold_filename(old_name)
+                # The file frees its own name, so a case-only rename is
+                # not mistaken for a collision with itself.
+                names_set.discard(old_key)
+                try:
+                    # The snapshot's case rules come from the platform, so
+                    # confirm the pick on disk (a case-insensitive mount
+                    # would otherwise let os.rename overwrite a file).
+                    while True:
+                        final_filename = get_unique_filename(
+                            dir_path, target_filename, names_set
+                        )
+                        new_path = os.path.join(dir_path, final_filename)
+                        if old_name == final_filename or not self._is_taken(
+                            old_path, new_path
+                        ):
+                            break
+                        names_set.add(fold_filename(final_filename))
+                    if old_name != final_filename and self._is_same_file(
+                        old_path, new_path
+                    ):
+                        # Case-only rename on a case-insensitive filesystem
+                        temp_path = old_path + ".tmp"
+                        os.rename(old_path, temp_path)
+                        os.rename(temp_path, new_path)
+                    else:
+                        os.rename(old_path, new_path)
+                except OSError:
+                    names_set.add(old_key)
+                    raise
+                names_set.add(fold_filename(final_filename))
+                self._handle_sidecars(
+                    old_path, new_path, final_filename, names_set
                 )
-                with manager.model_class._meta.database.atomic():
-                    manager.model_class.update(
-                        path=new_path,
-                        filename=final_filename,
-                        name=new_stem,
-                        dir_path=dir_path,
-                    ).where(manager.model_class.id == change["id"]).execute()
-                if (
-                    change["current_name"]
-                    and change["current_name"] != new_stem
-                ):
-                    name_map[change["current_name"]] = new_stem
+                fields = {
+                    "path": new_path,
+                    "filename": final_filename,
+                    "name": os.path.splitext(final_filename)[0],
+                    "dir_path": dir_path,
+                }
                 change["status"] = "Success"
+            except FileNotFoundError:
+                change["status"] = "File Missing"
             except Exception as e:
                 change["status"] = f"Error: {e}"
-                import traceback
+                logger.debug(
+                    "Rename failed for %s",
+                    change["current_path"],
+                    exc_info=True,
+                )
+            results.append((change, fields))
+        return results
 
-                traceback.print_exc()
-        return name_map
+    @staticmethod
+    def _flush_renames(
+        pending: List[_PendingRename], name_map: Dict[str, str]
+    ) -> None:
+        """
+        Writes queued rename records, one transaction per database, and
+        records the committed renames in name_map for history patching.
+
+        Logic: Applies pending DB updates and clears the queue; on failure
+        the affected changes are flagged since their files already moved,
+        and they are left out of name_map.
+        """
+        if not pending:
+            return
+        by_db: Dict[Any, List[_PendingRename]] = {}
+        for entry in pending:
+            by_db.setdefault(entry[0].model_class._meta.database, []).append(
+                entry
+            )
+        pending.clear()
+        for db, entries in by_db.items():
+            try:
+                with db.atomic():
+                    for manager, change, fields in entries:
+                        model = manager.model_class
+                        model.update(**fields).where(
+                            model.id == change["id"]
+                        ).execute()
+            except Exception as e:
+                for _, change, _ in entries:
+                    change["status"] = f"Error: {e}"
+                continue
+            for _, change, fields in entries:
+                old_name = change["current_name"]
+                if old_name and old_name != fields["name"]:
+                    name_map[old_name] = fields["name"]
+
+    @staticmethod
+    def _is_same_file(path_a: str, path_b: str) -> bool:
+        """Logic: Reports whether both paths name the same existing entry."""
+        try:
+            return os.path.samefile(path_a, path_b)
+        except OSError:
+            return False
+
+    @classmethod
+    def _is_taken(cls, src_path: str, dst_path: str) -> bool:
+        """Logic: Reports whether dst_path exists as an entry other than
+        src_path, i.e. renaming onto it would overwrite another file."""
+        return os.path.lexists(dst_path) and not cls._is_same_file(
+            src_path, dst_path
+        )
+
+    @staticmethod
+    def _list_dir(dir_path: str) -> Set[str]:
+        """Logic: Snapshots the entry names of a directory, folded with
+        fold_filename so lookups follow the filesystem's case rules."""
+        try:
+            with os.scandir(dir_path) as it:
+                return {fold_filename(entry.name) for entry in it}
+        except OSError:
+            return set()
 
     def _handle_sidecars(
-        self, old_path_base: str, new_path_base: str, new_filename: str
+        self,
+        old_path_base: str,
+        new_path_base: str,
+        new_filename: str,
+        names_set: Optional[Set[str]] = None,
     ) -> None:
         """Renames associated files like .json, .png, etc.
 
+        names_set is a snapshot of the directory's entry names (folded by
+        fold_filename); it is taken here when not given and is kept up to
+        date with the renames.
+
         Logic: Renames existing sidecar files."""
         base_old = os.path.splitext(old_path_base)[0]
         base_new = os.path.splitext(new_path_base)[0]
+        if names_set is None:
+            names_set = self._list_dir(os.path.dirname(base_old))
+        stem_old = os.path.basename(base_old)
+        stem_new = os.path.basename(base_new)
         extensions = [
             ".json",
             ".preview.png",
@@ -140,35 +365,58 @@ class LibraryCleanerService:
             ".civitai.info",
         ]
         for ext in extensions:
-            old_sidecar = f"{base_old}{ext}"
-            new_sidecar = f"{base_new}{ext}"
-            if os.path.exists(old_sidecar):
-                if not os.path.exists(new_sidecar):
-                    try:
-                        os.rename(old_sidecar, new_sidecar)
-                    except OSError:
-                        pass
+            old_key = fold_filename(f"{stem_old}{ext}")
+            new_key = fold_filename(f"{stem_new}{ext}")
+            # The snapshot guards the target; os.rename overwrites on POSIX
+            # (including macOS, where the names only need to match by case).
+            if old_key not in names_set:
+                continue
+            if new_key in names_set and new_key != old_key:
+                continue
+            src = f"{base_old}{ext}"
+            dst = f"{base_new}{ext}"
+            # The snapshot's case rules may not match this mount
+            if self._is_taken(src, dst):
+                names_set.add(new_key)
+                continue
+            try:
+                os.rename(src, dst)
+            except FileNotFoundError:
+                names_set.discard(old_key)
+                continue
+            except OSError:
+                continue
+            names_set.discard(old_key)
+            names_set.add(new_key)
 
     def _patch_json_content(self, json_path: str, new_filename: str) -> None:
         """Updates 'files' list in metadata JSON to match new filename.
 
-        Logic: Patches filename in metadata JSON."""
+        Logic: Patches filename in metadata JSON; skips the write when no
+        entry needed renaming and replaces the file atomically."""
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_path, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw)
             updated = False
             if "files" in data and isinstance(data["files"], list):
                 for file_node in data["files"]:
                     if (
                         file_node.get("type") == "Model"
                         or file_node.get("primary") is True
-                    ):
+                    ) and file_node.get("name") != new_filename:
                         file_node["name"] = new_filename
                         updated = True
-            if updated:
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4, ensure_ascii=False)
-        except (json.JSONDecodeError, IOError):
+            if not updated:
+                return
+            new_raw = json.dumps(data, indent=2, ensure_ascii=False).encode(
+                "utf-8"
+            )
+            tmp_path = f"{json_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(new_raw)
+            os.replace(tmp_path, json_path)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             pass
 
     def patch_history(
@@ -181,29 +429,40 @@ class LibraryCleanerService:
         """
         if not name_mapping:
             return 0
-        history_items = self.history.get_all()
-        total = len(history_items)
+        # Exact spelling wins; casefold covers IGNORECASE matches such as
+        # 'ſ' for 's' whose lower() is not a mapping key.
+        lookup = {old.casefold(): new for old, new in name_mapping.items()}
+        rename_re = _compile_rename_pattern(tuple(sorted(name_mapping)))
+
+        def _resolve(matched: str) -> Optional[str]:
+            new = name_mapping.get(matched)
+            if new is None:
+                new = lookup.get(matched.casefold())
+            return new
+
+        def _repl(m: Match[str]) -> str:
+            if m.group(1) is not None:
+                new = _resolve(m.group(1))
+                return m.group(0) if new is None else f"<lora:{new}:"
+            new = _resolve(m.group(2))
+            return m.group(0) if new is None else new
+
+        total = self.history.get_count()
         updated_count = 0
-        for i, entry in enumerate(history_items):
+        pending: List[Tuple[str, Dict[str, str]]] = []
+        for i, entry in enumerate(self._iter_history()):
             if callback and i % 10 == 0:
                 callback(i, total, "Patching History...")
-            prompt = entry["prompt"] or ""
-            original_prompt = prompt
-            for old_name, new_name in name_mapping.items():
-                if old_name not in prompt:
-                    continue
-                esc_old = re.escape(old_name)
-                lora_pattern = re.compile(f"<lora:{esc_old}:", re.IGNORECASE)
-                prompt = lora_pattern.sub(f"<lora:{new_name}:", prompt)
-                emb_pattern = re.compile(
-                    "(?<!\\w)" + esc_old + "(?!\\w)", re.IGNORECASE
-                )
-                prompt = emb_pattern.sub(new_name, prompt)
+            original_prompt = entry["prompt"] or ""
+            prompt = rename_re.sub(_repl, original_prompt)
             if prompt != original_prompt:
-                self.history.model_class.update(prompt=prompt).where(
-                    self.history.model_class.uuid == entry["uuid"]
-                ).execute()
+                pending.append((entry["uuid"], {"prompt": prompt}))
                 updated_count += 1
+                if len(pending) >= self._UPDATE_BATCH_SIZE:
+                    self.history.bulk_update(pending)
+                    pending = []
+        if pending:
+            self.history.bulk_update(pending)
         return updated_count
 
     def fix_absent_loras(
@@ -219,27 +478,30 @@ class LibraryCleanerService:
         Logic: Identifies missing LoRAs in history, prompts user
         to resolve, and updates history.
         """
-        lora_cache = {}
-        for item in self.loras.get_all():
-            lora_cache[item["name"]] = item
-            if item.get("alias"):
-                lora_cache[item["alias"]] = item
-        available_names_list = sorted(
-            list(set((item["name"] for item in lora_cache.values())))
-        )
+        lora_cache: Dict[str, Dict[str, Any]] = {}
+        names_set: Set[str] = set()
+        for item in self.loras.get_all_slim(self._LORA_CACHE_FIELDS):
+            name = item["name"]
+            lora_cache[name] = item
+            names_set.add(name)
+            alias = item["alias"]
+            if alias:
+                lora_cache[alias] = item
+        lora_cache_ci = {k.lower(): v for k, v in lora_cache.items()}
+        # Only needed once the resolver is actually invoked.
+        available_names_list: Optional[List[str]] = None
         decision_cache: Dict[str, Optional[str]] = {}
-        history_items = self.history.get_all()
-        total = len(history_items)
+        total = self.history.get_count()
         updated_count = 0
-        for i, entry in enumerate(history_items):
+        pending: List[Tuple[str, Dict[str, str]]] = []
+        for i, entry in enumerate(self._iter_history()):
             if progress_callback and i % 10 == 0:
                 progress_callback(
                     i, total, "Scanning History for missing LoRAs..."
                 )
             original_prompt = entry.get("prompt", "")
-            if not original_prompt:
+            if not original_prompt or "<lora:" not in original_prompt:
                 continue
-            current_prompt = original_prompt
             metadata = entry.get("metadata", {}) or {}
             used_networks = metadata.get("used_networks", [])
             existing_meta_names = {
@@ -247,33 +509,38 @@ class LibraryCleanerService:
                 for n in used_networks
                 if n.get("type") == "lora"
             }
-            prompt_changed = False
             meta_changed = False
-            matches = list(self._LORA_PATTERN.finditer(current_prompt))
-            for match in matches:
-                full_tag = match.group(0)
+            # (start, end, replacement) spans, applied in one pass below
+            subs: List[Tuple[int, int, str]] = []
+            for match in self._LORA_PATTERN.finditer(original_prompt):
                 name_in_prompt = match.group(1)
                 strength_str = match.group(2)
                 try:
                     strength = float(strength_str)
                 except ValueError:
                     strength = 1.0
-                net_info = lora_cache.get(name_in_prompt)
+                net_info = lora_cache.get(name_in_prompt) or lora_cache_ci.get(
+                    name_in_prompt.lower()
+                )
                 if not net_info:
                     if name_in_prompt in decision_cache:
                         resolved_name = decision_cache[name_in_prompt]
                     else:
+                        if available_names_list is None:
+                            available_names_list = sorted(names_set)
                         resolved_name = resolver_callback(
                             name_in_prompt, available_names_list
                         )
                         decision_cache[name_in_prompt] = resolved_name
                     if resolved_name:
                         net_info = lora_cache.get(resolved_name)
-                        new_tag = f"<lora:{resolved_name}:{strength_str}>"
-                        current_prompt = current_prompt.replace(
-                            full_tag, new_tag
+                        subs.append(
+                            (
+                                match.start(),
+                                match.end(),
+                                f"<lora:{resolved_name}:{strength_str}>",
+                            )
                         )
-                        prompt_changed = True
                         name_in_prompt = resolved_name
                 if net_info and name_in_prompt not in existing_meta_names:
                     network_data = {
@@ -282,20 +549,30 @@ class LibraryCleanerService:
                         "strength": strength,
                         "content_hash": net_info["content_hash"],
                         "remote_version_id": net_info["remote_version_id"],
-                        "triggers": net_info["trigger_words"],
+                        "triggers": net_info["trigger_words"] or "",
                     }
                     used_networks.append(network_data)
                     existing_meta_names.add(name_in_prompt)
                     meta_changed = True
             updates = {}
-            if prompt_changed:
-                updates["prompt"] = current_prompt
+            if subs:
+                parts: List[str] = []
+                last = 0
+                for start, end, new_tag in subs:
+                    parts.append(original_prompt[last:start])
+                    parts.append(new_tag)
+                    last = end
+                parts.append(original_prompt[last:])
+                updates["prompt"] = "".join(parts)
             if meta_changed:
                 metadata["used_networks"] = used_networks
                 updates["metadata"] = json.dumps(metadata)
             if updates:
-                self.history.model_class.update(**updates).where(
-                    self.history.model_class.uuid == entry["uuid"]
-                ).execute()
+                pending.append((entry["uuid"], updates))
                 updated_count += 1
+                if len(pending) >= self._UPDATE_BATCH_SIZE:
+                    self.history.bulk_update(pending)
+                    pending = []
+        if pending:
+            self.history.bulk_update(pending)
         return updated_count
@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib
 import inspect
 import pkgutil
+import sys
+import threading
 from typing import TYPE_CHECKING, List
 
 from sd_cpp_gui.domain.plugins.interface import IPlugin
@@ -23,6 +25,9 @@ class PluginManager:
         self.container = container
         self._plugins: List[IPlugin] = []
         self.plugins_map: dict[str, IPlugin] = {}
+        # Cleared while background discovery runs; readers wait on it
+        self._ready = threading.Event()
+        self._ready.set()
 
     def register(self, plugin: IPlugin) -> None:
         """
@@ -53,9 +58,33 @@ class PluginManager:
     def get_active_plugins(self) -> List[IPlugin]:
         """Returns list of successfully registered plugins.
 
-        Logic: Returns active plugins."""
+        Logic: Waits for any background discovery, then returns active
+        plugins."""
+        self._ready.wait()
         return self._plugins
 
+    def discover_in_background(self, package_path: str) -> threading.Thread:
+        """
+        Runs discover_and_register on a daemon thread so plugin imports
+        overlap with UI startup. get_active_plugins blocks until done.
+
+        Logic: Clears the ready flag, discovers on a worker thread and
+        sets the flag when finished.
+        """
+        self._ready.clear()
+
+        def _run() -> None:
+            try:
+                self.discover_and_register(package_path)
+            finally:
+                self._ready.set()
+
+        thread = threading.Thread(
+            target=_run, name="plugin-discovery", daemon=True
+        )
+        thread.start()
+        return thread
+
     def discover_and_register(self, package_path: str) -> None:
         """
         Automatically discovers and registers plugins from a given package path.
@@ -76,18 +105,24 @@ class PluginManager:
 
             for _, module_name, _ in pkgutil.iter_modules(package.__path__):
                 full_module_name = f"{package_path}.{module_name}"
-                module = importlib.import_module(full_module_name)
-
-                for _, obj in inspect.getmembers(module):
-                    if (
-                        inspect.isclass(obj)
-                        and issubclass(obj, IPlugin)
-                        and obj is not IPlugin
-                        and not inspect.isabstract(obj)
-                        and obj.__module__ == module.__name__
-                    ):
-                        logger.info("Discovered plugin class: %s", obj.__name__)
-                        self.register(obj())
+                module = sys.modules.get(full_module_name)
+                if module is None:
+                    module = importlib.import_module(full_module_name)
+
+                # Own attributes only; sorted by name as getmembers did.
+                found = [
+                    obj
+                    for obj in vars(module).values()
+                    if isinstance(obj, type)
+                    and obj.__module__ == module.__name__
+                    and issubclass(obj, IPlugin)
+                    and obj is not IPlugin
+                    and not inspect.isabstract(obj)
+                ]
+                found.sort(key=lambda cls: cls.__name__)
+                for obj in found:
+                    logger.info("Discovered plugin class: %s", obj.__name__)
+                    self.register(obj())
         except Exception as e:
             logger.error(
                 "Error during plugin discovery in %s: %s",
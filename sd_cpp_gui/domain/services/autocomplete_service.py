@@ -1,10 +1,16 @@
-import re
+import sqlite3
 import threading
 import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import merge
+from itertools import islice
+from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-from peewee import SqliteDatabase
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from sd_cpp_gui.infrastructure.logger import get_logger
 
@@ -19,23 +25,158 @@ except ImportError:
     RAPIDFUZZ_AVAILABLE = False
 
 
+# Token delimiters for search queries (besides whitespace)
+_DELIMS = frozenset("<>(){}[],.|:")
+_DELIM_TRANS = str.maketrans(dict.fromkeys(_DELIMS, " "))
+
+
+@lru_cache(maxsize=8192)
+def _format_popularity(count: int) -> str:
+    """Formats popularity count (e.g. 1.2M, 50k); memoized, since counts
+    are heavy-tailed and repeat across candidates."""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.0f}k"
+    return str(count)
+
+
+class _PrefixIndex:
+    """
+    Prefix lookup over tag names ordered by popularity.
+
+    Names are also kept alphabetically with their popularity rank, so a
+    prefix maps to a contiguous slice found by bisect. Short prefixes,
+    whose slices are huge, get their best-ranked names precomputed.
+    """
+
+    __slots__ = ("_by_pop", "_sorted", "_ranks", "_top")
+
+    TOP_DEPTH = 2
+    TOP_K = 64
+
+    def __init__(self, names_by_pop: List[str]) -> None:
+        self._by_pop = names_by_pop
+        order = sorted(range(len(names_by_pop)), key=names_by_pop.__getitem__)
+        self._sorted = [names_by_pop[i] for i in order]
+        self._ranks = array("l", order)
+        top: Dict[str, List[int]] = {}
+        depth, k = self.TOP_DEPTH, self.TOP_K
+        for rank, name in enumerate(names_by_pop):
+            for d in range(1, min(len(name), depth) + 1):
+                bucket = top.setdefault(name[:d], [])
+                if len(bucket) < k:
+                    bucket.append(rank)
+        self._top = top
+
+    def _ranks_in_range(self, prefix: str, after: int = -1) -> List[int]:
+        """Popularity ranks (> after) of all names starting with prefix."""
+        lo = bisect_left(self._sorted, prefix)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        hi = bisect_left(self._sorted, upper, lo)
+        return sorted(r for r in self._ranks[lo:hi] if r > after)
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """Yields names starting with prefix, most popular first."""
+        if not prefix:
+            return
+        by_pop = self._by_pop
+        bucket = (
+            self._top.get(prefix) if len(prefix) <= self.TOP_DEPTH else None
+        )
+        if bucket is not None:
+            for rank in bucket:
+                yield by_pop[rank]
+            if len(bucket) < self.TOP_K:
+                return
+            # Only scan the full slice if the caller wants more
+            ranks = self._ranks_in_range(prefix, bucket[-1])
+        else:
+            ranks = self._ranks_in_range(prefix)
+        for rank in ranks:
+            yield by_pop[rank]
+
+
+# Fuzzy candidates may differ in length from the query by this fraction
+_FUZZY_LEN_BAND = 0.4
+
+
+@dataclass(frozen=True, slots=True)
+class _TagSnapshot:
+    """
+    Immutable tag index; replaced wholesale on load (RCU-style).
+    Metadata is stored column-wise: a tag's popularity rank (its position
+    in names) indexes the compact category/count arrays.
+    """
+
+    names: List[str]
+    rank_of: Dict[str, int]
+    categories: array
+    counts: array
+    prefix_index: _PrefixIndex
+    # name length -> popularity ranks of names with that length
+    ranks_by_len: Dict[int, array]
+
+    def fuzzy_candidates(self, fragment: str) -> List[str]:
+        """Names whose length is within the fuzzy band of fragment's,
+        most popular first."""
+        size = len(fragment)
+        band = ceil(size * _FUZZY_LEN_BAND)
+        buckets = [
+            self.ranks_by_len[n]
+            for n in range(max(1, size - band), size + band + 1)
+            if n in self.ranks_by_len
+        ]
+        names = self.names
+        return [names[rank] for rank in merge(*buckets)]
+
+
+_EMPTY_SNAPSHOT = _TagSnapshot(
+    [], {}, array("h"), array("q"), _PrefixIndex([]), {}
+)
+
+
 class AutocompleteService:
+    # Max cached search results (repeated keystrokes, backspace/retype)
+    _SEARCH_CACHE_SIZE = 128
+    # Bytes of the tag DB to memory-map (reads skip read() syscalls)
+    _MMAP_SIZE = 256 * 1024 * 1024
+    # Contextual suggestions; LIKE filters by fragment directly in the DB
+    _BIGRAM_SQL = (
+        "SELECT next_word FROM bigram "
+        "WHERE current_word = ? AND next_word LIKE ? || '%' "
+        "ORDER BY score DESC LIMIT ?"
+    )
+
     def __init__(self, assets_path: Path):
         """Initializes service with DB path and internal structures."""
         self.db_path = assets_path
 
-        # OPTIMIZATION: Only keep names in RAM for sorting/fuzzy.
-        # Dropped _tags_meta (dict) and _bigrams_db (dict) to save memory.
-        self._tags_names: List[str] = []
+        # Names (by popularity) for sorting/fuzzy, metadata for hydration.
+        # Bigrams stay in the DB. Readers grab the reference once and never
+        # lock; load() publishes a new snapshot by plain assignment.
+        self._snapshot = _EMPTY_SNAPSHOT
 
         self._active_triggers_map: Dict[str, List[str]] = {}
         self._active_triggers_list: List[str] = []
+        # trigger -> number of active networks providing it
+        self._trigger_counts: Counter[str] = Counter()
+        # Bumped on every trigger change; part of the search cache key
+        self._triggers_version = 0
+        # (query, limit, triggers_version) -> (snapshot, results)
+        self._search_cache: OrderedDict[
+            Tuple[str, int, int], Tuple[_TagSnapshot, List[Any]]
+        ] = OrderedDict()
 
         self._loaded = False
+        # Serializes load() only; search() reads published snapshots
         self._lock = threading.Lock()
 
-        # Persistent DB connection for fast lookups
-        self._db = None
+        # Persistent read-only DB connection per thread, so callers on
+        # different threads never serialize on one connection
+        self._tls = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
 
         self.COLORS = {
             0: "#8be9fd",
@@ -57,38 +198,82 @@ class AutocompleteService:
         with self._lock:
             t0 = time.time()
 
-            # Initialize persistent connection
-            if self._db is None:
-                self._db = SqliteDatabase(
-                    f"file:{self.db_path}?mode=ro", uri=True
-                )
-
             try:
-                self._db.connect(reuse_if_open=True)
-
-                # OPTIMIZATION: Only fetch names.
                 # We rely on the DB ORDER BY to ensure the list is
                 # sorted by popularity.
-                cursor = self._db.execute_sql(
-                    "SELECT name FROM tag ORDER BY count DESC"
+                cursor = self._conn().execute(
+                    "SELECT name, category, count FROM tag ORDER BY count DESC"
                 )
 
-                # Fetching one column is faster and uses less memory
-                # than fetching all
-                self._tags_names = [r[0] for r in cursor.fetchall()]
+                # Metadata kept in RAM so hydration needs no query
+                names: List[str] = []
+                rank_of: Dict[str, int] = {}
+                categories = array("h")
+                counts = array("q")
+                ranks_by_len: Dict[int, array] = {}
+                for rank, (name, category, count) in enumerate(cursor):
+                    names.append(name)
+                    rank_of[name] = rank
+                    categories.append(category or 0)
+                    counts.append(count or 0)
+                    bucket = ranks_by_len.get(len(name))
+                    if bucket is None:
+                        bucket = ranks_by_len[len(name)] = array("l")
+                    bucket.append(rank)
+                self._snapshot = _TagSnapshot(
+                    names,
+                    rank_of,
+                    categories,
+                    counts,
+                    _PrefixIndex(names),
+                    ranks_by_len,
+                )
 
                 self._loaded = True
 
                 logger.info(
-                    "Autocomplete service ready in %.3fs (Lightweight Mode)",
+                    "Autocomplete service ready in %.3fs",
                     time.time() - t0,
                 )
 
             except Exception as e:
                 logger.error(f"Failed to load autocomplete database: {e}")
                 self._loaded = False
-                if not self._db.is_closed():
-                    self._db.close()
+                self._close_connections()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Returns this thread's connection, opening it on first use."""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            self._tls.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def _close_connections(self) -> None:
+        """Closes every per-thread connection opened so far."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        # Threads still holding a closed one reopen on their next call
+        self._tls = threading.local()
+        for conn in conns:
+            conn.close()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Opens a read-only, memory-mapped connection to the tag DB.
+        The DB is a shipped asset the app never writes, so it is opened
+        immutable and SQLite skips file locking and change detection.
+        sqlite3 caches prepared statements per connection, so repeated
+        queries skip SQL parsing."""
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA query_only = 1")
+        conn.execute(f"PRAGMA mmap_size = {self._MMAP_SIZE}")
+        return conn
 
     def on_state_change(
         self, event_type: str, key: str, value: Any = None
@@ -103,39 +288,69 @@ class AutocompleteService:
                 keep = value.get("keep_networks", False)
             if not keep:
                 self._active_triggers_map.clear()
-                self._update_active_triggers_list()
+                self._trigger_counts.clear()
+                self._active_triggers_list = []
+                self._triggers_version += 1
             return
 
         if event_type not in ("lora", "embedding"):
             return
 
-        unique_key = f"{event_type}:{key}"
-
-        if value is None:
-            if unique_key in self._active_triggers_map:
-                del self._active_triggers_map[unique_key]
-                self._update_active_triggers_list()
-        else:
+        t_list: Optional[List[str]] = None
+        if value is not None:
             triggers = getattr(value, "triggers", None)
             if triggers:
                 t_list = [
                     t.strip().lower() for t in triggers.split(",") if t.strip()
                 ]
-                if t_list:
-                    self._active_triggers_map[unique_key] = t_list
-                    self._update_active_triggers_list()
-                elif unique_key in self._active_triggers_map:
-                    del self._active_triggers_map[unique_key]
-                    self._update_active_triggers_list()
-            elif unique_key in self._active_triggers_map:
-                del self._active_triggers_map[unique_key]
-                self._update_active_triggers_list()
-
-    def _update_active_triggers_list(self):
-        """Rebuilds sorted list of active triggers from map."""
-        all_triggers = set().union(*self._active_triggers_map.values())
-        logger.debug("Active triggers updated: %s", all_triggers)
-        self._active_triggers_list = sorted(list(all_triggers))
+        self._set_network_triggers(f"{event_type}:{key}", t_list or None)
+
+    def _set_network_triggers(
+        self, unique_key: str, t_list: Optional[List[str]]
+    ) -> None:
+        """Sets (or clears, if None) one network's triggers and patches the
+        sorted active list with the delta instead of re-sorting it.
+        The new list is published by assignment; readers never see it
+        half-built."""
+        triggers_map = self._active_triggers_map
+        old = triggers_map.get(unique_key)
+        if t_list is None:
+            if old is None:
+                return
+            del triggers_map[unique_key]
+        else:
+            if old == t_list:
+                return
+            triggers_map[unique_key] = t_list
+        old_set = set(old or ())
+        new_set = set(t_list or ())
+        # Reference counts: a trigger stays listed while any active
+        # network still provides it
+        counts = self._trigger_counts
+        removed = []
+        for trigger in old_set - new_set:
+            counts[trigger] -= 1
+            if counts[trigger] <= 0:
+                del counts[trigger]
+                removed.append(trigger)
+        added = []
+        for trigger in new_set - old_set:
+            counts[trigger] += 1
+            if counts[trigger] == 1:
+                added.append(trigger)
+
+        active = list(self._active_triggers_list)
+        for trigger in removed:
+            i = bisect_left(active, trigger)
+            if i < len(active) and active[i] == trigger:
+                del active[i]
+        for trigger in added:
+            i = bisect_left(active, trigger)
+            if i == len(active) or active[i] != trigger:
+                active.insert(i, trigger)
+        logger.debug("Active triggers updated: %s", active)
+        self._active_triggers_list = active
+        self._triggers_version += 1
 
     def search(
         self, query: str, limit: int = 20
@@ -143,19 +358,39 @@ class AutocompleteService:
         """
         Performs multi-stage autocomplete search (Context -> Prefix -> Fuzzy).
         Returns: List[(display, value, color, category, name)].
+        Repeated queries are served from a small LRU cache.
         """
         if not self._loaded or not query:
             return []
-
+        snapshot = self._snapshot
+        key = (query, limit, self._triggers_version)
+        cache = self._search_cache
+        hit = cache.get(key)
+        if hit is not None and hit[0] is snapshot:
+            cache.move_to_end(key)
+            return list(hit[1])
+
+        results = self._search(
+            query, limit, snapshot, self._active_triggers_list
+        )
+        cache[key] = (snapshot, results)
+        if len(cache) > self._SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return list(results)
+
+    def _search(
+        self,
+        query: str,
+        limit: int,
+        snapshot: _TagSnapshot,
+        active_triggers: List[str],
+    ) -> List[Tuple[str, str, str, int, str]]:
+        """Runs the search pipeline against one tag snapshot."""
         # 1. Parsing
         query = query.lower().lstrip()
-        parts = re.split(r"[\s<>\(\)\{\}\[\],\.\|:]", query)
-        last_empty = False
-
-        if parts[-1] == "":
-            last_empty = True
-        parts = list(filter(None, parts))
-        if last_empty:
+        # Delimiters become spaces; split() drops the empty tokens
+        parts = query.translate(_DELIM_TRANS).split()
+        if not parts or query[-1] in _DELIMS or query[-1].isspace():
             parts.append("")
 
         target_fragment = parts[-1]
@@ -178,23 +413,26 @@ class AutocompleteService:
         # 2.5 Active Triggers Search
         if (
             len(results) < limit
-            and self._active_triggers_list
+            and active_triggers
             and len(target_fragment) >= 1
         ):
-            for trigger in self._active_triggers_list:
-                if trigger.lower().startswith(target_fragment):
-                    if trigger in seen:
-                        continue
-                    full_value = (
-                        f"{prefix_str} {trigger}" if prefix_str else trigger
-                    )
-                    display = f"{trigger} (Active)"
-                    results.append(
-                        (display, full_value, self.COLORS[5], 5, trigger)
-                    )
-                    seen.add(trigger)
-                    if len(results) >= limit:
-                        break
+            # Sorted and already lowercased: matches form one contiguous run
+            lo = bisect_left(active_triggers, target_fragment)
+            for trigger in islice(active_triggers, lo, None):
+                if not trigger.startswith(target_fragment):
+                    break
+                if trigger in seen:
+                    continue
+                full_value = (
+                    f"{prefix_str} {trigger}" if prefix_str else trigger
+                )
+                display = f"{trigger} (Active)"
+                results.append(
+                    (display, full_value, self.COLORS[5], 5, trigger)
+                )
+                seen.add(trigger)
+                if len(results) >= limit:
+                    break
 
         if len(results) >= limit:
             return results[:limit]
@@ -205,19 +443,16 @@ class AutocompleteService:
         if len(target_fragment) >= 1:
             needed = limit - len(results)
 
-            # Prefix Search in RAM (Fast, preserves popularity order)
-            # Since self._tags_names is sorted by count DESC, the first
-            # matches are the best.
+            # Prefix Search in RAM (Indexed, preserves popularity order)
             count_found = 0
-            for name in self._tags_names:
-                if name.startswith(target_fragment):
-                    if name in seen:
-                        continue
-                    candidates_to_fetch.append(name)
-                    seen.add(name)
-                    count_found += 1
-                    if count_found >= needed:
-                        break
+            for name in snapshot.prefix_index.iter_prefix(target_fragment):
+                if name in seen:
+                    continue
+                candidates_to_fetch.append(name)
+                seen.add(name)
+                count_found += 1
+                if count_found >= needed:
+                    break
 
             # Fuzzy Search (only if needed and available)
             if (
@@ -225,9 +460,10 @@ class AutocompleteService:
                 and len(results) + len(candidates_to_fetch) < limit
                 and len(target_fragment) >= 3
             ):
+                # Length-band prefilter: WRatio only sees plausible names
                 fuzzy_hits = process.extract(
                     target_fragment,
-                    self._tags_names,
+                    snapshot.fuzzy_candidates(target_fragment),
                     scorer=fuzz.WRatio,
                     limit=limit * 2,
                     score_cutoff=65,
@@ -241,10 +477,10 @@ class AutocompleteService:
                     candidates_to_fetch.append(match_name)
                     seen.add(match_name)
 
-        # 4. Hydrate Metadata (Optimized: Single SQL Batch Query)
+        # 4. Hydrate Metadata (In-memory lookup)
         if candidates_to_fetch:
             self._hydrate_and_add_results(
-                results, candidates_to_fetch, prefix_str
+                results, candidates_to_fetch, prefix_str, snapshot
             )
 
         return results[:limit]
@@ -254,15 +490,8 @@ class AutocompleteService:
     ):
         """Fetches contextual bigram suggestions from DB."""
         try:
-            # Efficient SQL query to replace the in-memory dictionary lookup
-            # We use LIKE to filter by fragment directly in the DB
-            query = (
-                "SELECT next_word FROM bigram "
-                "WHERE current_word = ? AND next_word LIKE ? || '%' "
-                "ORDER BY score DESC LIMIT ?"
-            )
-            cursor = self._db.execute_sql(
-                query, (context_word, target_fragment, limit)
+            cursor = self._conn().execute(
+                self._BIGRAM_SQL, (context_word, target_fragment, limit)
             )
 
             for (sugg,) in cursor.fetchall():
@@ -297,8 +526,8 @@ class AutocompleteService:
                 LIMIT ?
             """
 
-            # execute_sql usually returns a cursor
-            cursor = self._db.execute_sql(
+            # execute returns a cursor
+            cursor = self._conn().execute(
                 query, (context_word, target_fragment, limit)
             )
 
@@ -326,45 +555,29 @@ class AutocompleteService:
         except Exception as e:
             logger.error(f"Contextual bigram search failed: {e}")
 
-    def _hydrate_and_add_results(self, results, names, prefix_str):
-        """Fetches metadata for candidates in batch and adds to results."""
-        if not names:
-            return
-
-        try:
-            # Create placeholders for IN clause
-            placeholders = ",".join(["?"] * len(names))
-            query = (
-                "SELECT name, category, count FROM tag WHERE name "
-                f"IN ({placeholders})"
-            )
-
-            cursor = self._db.execute_sql(query, names)
-
-            # Map results for O(1) lookup
-            meta_map = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
-
-            # Add to results in the original order of 'names' (which
-            # preserves relevance)
-            for name in names:
-                cat, count = meta_map.get(name, (0, 0))  # Default if not found
-
-                full_value = f"{prefix_str} {name}" if prefix_str else name
-                display = f"{name} ({self._format_pop(count)})"
-                color = self.COLORS.get(cat, "#ffffff")
-
-                results.append((display, full_value, color, cat, name))
-
-        except Exception as e:
-            logger.error(f"Metadata hydration failed: {e}")
+    def _hydrate_and_add_results(self, results, names, prefix_str, snapshot):
+        """Adds candidates to results with metadata from the RAM cache."""
+        colors = self.COLORS
+        rank_of = snapshot.rank_of
+        categories = snapshot.categories
+        counts = snapshot.counts
+        # Keep the original order of 'names' (which preserves relevance)
+        for name in names:
+            rank = rank_of.get(name)
+            if rank is None:  # Default if not found
+                cat, count = 0, 0
+            else:
+                cat, count = categories[rank], counts[rank]
+
+            full_value = f"{prefix_str} {name}" if prefix_str else name
+            display = f"{name} ({self._format_pop(count)})"
+            color = colors.get(cat, "#ffffff")
+
+            results.append((display, full_value, color, cat, name))
 
     def _format_pop(self, count: int) -> str:
         """Formats popularity count (e.g. 1.2M, 50k)."""
-        if count >= 1_000_000:
-            return f"{count / 1_000_000:.1f}M"
-        if count >= 1_000:
-            return f"{count / 1_000:.0f}k"
-        return str(count)
+        return _format_popularity(count)
 
     def get_next_prob(self, current_word, limit=5):
         """
@@ -378,7 +591,7 @@ class AutocompleteService:
             ORDER BY score DESC
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (current_word, limit))
+        cursor = self._conn().execute(query, (current_word, limit))
         return cursor.fetchall()
 
     def get_previous_prob(self, next_word, limit=5):
@@ -393,7 +606,7 @@ class AutocompleteService:
             ORDER BY score DESC
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (next_word, limit))
+        cursor = self._conn().execute(query, (next_word, limit))
         return cursor.fetchall()
 
     def get_common_collocations(self, multiplier=5.0, limit=20):
@@ -408,7 +621,7 @@ class AutocompleteService:
             ORDER BY score DESC
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (multiplier, limit))
+        cursor = self._conn().execute(query, (multiplier, limit))
         return cursor.fetchall()
 
     def get_sentence_terminators(self, limit=10):
@@ -421,7 +634,7 @@ class AutocompleteService:
             ORDER BY frequency DESC
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (limit,))
+        cursor = self._conn().execute(query, (limit,))
         return cursor.fetchall()
 
     def suggest_trigrams(self, seed_word, limit=10):
@@ -440,7 +653,7 @@ class AutocompleteService:
             ORDER BY confidence DESC
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (seed_word, limit))
+        cursor = self._conn().execute(query, (seed_word, limit))
         for w1, w2, w3, conf in cursor.fetchall():
             yield {
                 "token": w1,
@@ -462,10 +675,10 @@ class AutocompleteService:
             ORDER BY score DESC 
             LIMIT ?
         """
-        cursor = self._db.execute_sql(query, (word1, word2, limit))
+        cursor = self._conn().execute(query, (word1, word2, limit))
         return cursor.fetchall()
 
     def __del__(self):
         """Closes DB connection on cleanup."""
-        if self._db and not self._db.is_closed():
-            self._db.close()
+        if getattr(self, "_conns", None):
+            self._close_connections()
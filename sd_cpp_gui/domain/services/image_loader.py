@@ -1,7 +1,6 @@
 import queue
 import threading
 from collections import OrderedDict
-from io import BytesIO
 from typing import Any, Callable
 from typing import OrderedDict as TOrderedDict
 from typing import Tuple
@@ -47,10 +46,13 @@ class ImageLoader:
         if not url:
             return
         with self._cache_lock:
-            if url in self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
                 self.cache.move_to_end(url)
-                callback(self.cache[url])
-                return
+        if cached is not None:
+            # Run UI callback outside the lock
+            callback(cached)
+            return
         self.queue.put((url, callback, size))
 
     def _worker(self) -> None:
@@ -70,17 +72,9 @@ class ImageLoader:
                         if cached:
                             tk_img = cached
                         else:
-                            resp = sess.get(url, timeout=10)
-                            if resp.status_code == 200:
-                                img_data = BytesIO(resp.content)
-                                pil_img = Image.open(img_data)
-                                pil_img.thumbnail(size)
-                                tk_img = ImageTk.PhotoImage(pil_img)
-                                with self._cache_lock:
-                                    self.cache[url] = tk_img
-                                    self.cache.move_to_end(url)
-                                    if len(self.cache) > self.max_cache_size:
-                                        self.cache.popitem(last=False)
+                            tk_img = self._fetch(sess, url, size)
+                            if tk_img:
+                                self._cache_put(url, tk_img)
                         if tk_img:
                             self._safe_callback(callback, tk_img)
                     except Exception:
@@ -90,6 +84,35 @@ class ImageLoader:
                 except queue.Empty:
                     pass
 
+    def _fetch(
+        self, sess: requests.Session, url: str, size: Tuple[int, int]
+    ) -> Any:
+        """
+        Streams an image into PIL and returns a thumbnail PhotoImage.
+        Logic: Decodes from the response stream (no content copy) and
+        releases the connection once pixels are loaded.
+        """
+        with sess.get(url, timeout=10, stream=True) as resp:
+            if resp.status_code != 200:
+                return None
+            resp.raw.decode_content = True
+            pil_img = Image.open(resp.raw)
+            # JPEG: decode at reduced DCT scale
+            pil_img.draft("RGB", size)
+            pil_img.load()
+        pil_img.thumbnail(size, Image.Resampling.BILINEAR)
+        return ImageTk.PhotoImage(pil_img)
+
+    def _cache_put(self, url: str, img: Any) -> None:
+        """Logic: Inserts as most recent and evicts the oldest entry."""
+        with self._cache_lock:
+            cache = self.cache
+            if url in cache:
+                cache.move_to_end(url)
+            cache[url] = img
+            if len(cache) > self.max_cache_size:
+                cache.popitem(last=False)
+
     def _safe_callback(self, cb: Callable[[Any], None], img: Any) -> None:
         """Executes callback safely suppressing exceptions.
 
@@ -3,11 +3,21 @@ Updated LibraryScanner to download preview images.
 """
 
 import hashlib
+import mmap
 import os
 import threading
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 from sd_cpp_gui.data.remote.remote_manager import RemoteManager
+from sd_cpp_gui.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class LibraryScanner:
@@ -16,6 +26,12 @@ class LibraryScanner:
     remote metadata.
     """
 
+    # Concurrent file hashes (disk bound) and remote lookups (network bound)
+    _HASH_WORKERS = 2
+    _FETCH_WORKERS = 4
+    # Bytes hashed per call; bounds how long a stop request waits
+    _HASH_SLICE = 64 * 1024 * 1024
+
     def __init__(
         self,
         managers: Dict[str, Any],
@@ -96,52 +112,125 @@ class LibraryScanner:
             self.finish_cb(0, 0)
             return
         success_count = 0
-        for i, (_, path, mgr) in enumerate(items_to_scan):
-            if self.stop_event.is_set():
-                break
-            fname = os.path.basename(path)
-            self.status_cb(f"Scanning [{i + 1}/{total}]: {fname}")
-            self.progress_cb(i / total * 100)
-            try:
-                sha256 = self._calc_hash(path)
-                if not sha256:
-                    continue
-                if hasattr(mgr, "update_hash"):
-                    mgr.update_hash(path, sha256)
-                version_dto = self.remote.fetch_rich_metadata(hash_value=sha256)
-                if version_dto:
-                    self.remote.sidecar.save_metadata(path, version_dto)
-                    if "_parent_model" in version_dto:
-                        self.remote.sidecar.save_metadata(
-                            path, version_dto["_parent_model"], suffix=".model"
-                        )  # type: ignore
-                    if version_dto.get("images"):
-                        preview_url = version_dto["images"][0].get("url")
-                        if preview_url:
-                            self.remote.sidecar.download_preview(
-                                path, preview_url
+        done = 0
+        # Hashing (disk/CPU) overlaps with lookups (network); DB writes
+        # stay on this thread.
+        hash_pool = ThreadPoolExecutor(max_workers=self._HASH_WORKERS)
+        fetch_pool = ThreadPoolExecutor(max_workers=self._FETCH_WORKERS)
+        try:
+            # Future -> (path, manager, sha256); sha256 is None while hashing
+            jobs: Dict[Future, Tuple[str, Any, Optional[str]]] = {
+                hash_pool.submit(self._calc_hash, path): (path, mgr, None)
+                for _, path, mgr in items_to_scan
+            }
+            pending = set(jobs)
+            while pending and not self.stop_event.is_set():
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path, mgr, sha256 = jobs.pop(future)
+                    fname = os.path.basename(path)
+                    try:
+                        if sha256 is None:
+                            sha256 = future.result()
+                            if not sha256:
+                                done += 1
+                                continue
+                            if hasattr(mgr, "update_hash"):
+                                mgr.update_hash(path, sha256)
+                            fetch = fetch_pool.submit(
+                                self._fetch_remote, path, sha256
+                            )
+                            jobs[fetch] = (path, mgr, sha256)
+                            pending.add(fetch)
+                            continue
+                        done += 1
+                        self.status_cb(f"Scanning [{done}/{total}]: {fname}")
+                        self.progress_cb(done / total * 100)
+                        version_dto = future.result()
+                        if version_dto and hasattr(mgr, "register_from_remote"):
+                            mgr.register_from_remote(
+                                path, version_dto, hash_value=sha256
                             )
-                    if hasattr(mgr, "register_from_remote"):
-                        mgr.register_from_remote(
-                            path, version_dto, hash_value=sha256
-                        )
-                        success_count += 1
-            except Exception as e:
-                print(f"Error scanning {fname}: {e}")
+                            success_count += 1
+                    except Exception as e:
+                        logger.error(f"Error scanning {fname}: {e}")
+        finally:
+            hash_pool.shutdown(wait=False, cancel_futures=True)
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
         self.progress_cb(100.0)
         self.finish_cb(success_count, total)
 
+    def _fetch_remote(self, path: str, sha256: str) -> Optional[Any]:
+        """
+        Looks up remote metadata for a hash and writes sidecars/preview.
+        Runs on the fetch pool; returns the version DTO or None.
+
+        Logic: Fetches metadata, saves sidecars, downloads preview.
+        """
+        if self.stop_event.is_set():
+            return None
+        version_dto = self.remote.fetch_rich_metadata(hash_value=sha256)
+        if not version_dto:
+            return None
+        self.remote.sidecar.save_metadata(path, version_dto)
+        if "_parent_model" in version_dto:
+            self.remote.sidecar.save_metadata(
+                path, version_dto["_parent_model"], suffix=".model"
+            )  # type: ignore
+        if version_dto.get("images"):
+            preview_url = version_dto["images"][0].get("url")
+            if preview_url:
+                self.remote.sidecar.download_preview(path, preview_url)
+        return version_dto
+
     def _calc_hash(self, path: str) -> Optional[str]:
         """Calculates SHA256 hash.
 
-        Logic: Calculates file SHA256 hash in chunks."""
-        sha256 = hashlib.sha256()
+        Logic: Memory-maps the file and feeds it to sha256 in large slices,
+        checking the stop event between slices. Falls back to
+        hashlib.file_digest when the file cannot be mapped (e.g. empty)."""
         try:
             with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(1048576), b""):
-                    if self.stop_event.is_set():
-                        return None
-                    sha256.update(chunk)
-            return sha256.hexdigest().upper()
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    digest = hashlib.file_digest(
+                        _StoppableReader(f, self.stop_event), "sha256"
+                    )
+                else:
+                    digest = hashlib.sha256()
+                    with mm, memoryview(mm) as view:
+                        step = self._HASH_SLICE
+                        for start in range(0, len(view), step):
+                            if self.stop_event.is_set():
+                                return None
+                            digest.update(view[start : start + step])
+            if self.stop_event.is_set():
+                return None
+            return digest.hexdigest().upper()
         except (OSError, IOError):
             return None
+
+
+class _StoppableReader:
+    """
+    Minimal binary reader for hashlib.file_digest that reports EOF once
+    the stop event is set, so hashing a large file can be cancelled.
+    """
+
+    __slots__ = ("_f", "_stop")
+
+    def __init__(self, f: BinaryIO, stop: threading.Event) -> None:
+        """Logic: Wraps file and stop event."""
+        self._f = f
+        self._stop = stop
+
+    def readable(self) -> bool:
+        """Logic: Always readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Logic: Fills buffer from file, or returns 0 if stopped."""
+        if self._stop.is_set():
+            return 0
+        return self._f.readinto(buffer)
@@ -7,17 +7,35 @@ import os
 from typing import Any, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from sd_cpp_gui.data.db.settings_manager import SettingsManager
 from sd_cpp_gui.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Try importing orjson (faster serializer); stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class SidecarService:
     def __init__(self, settings: SettingsManager):
-        """Logic: Initializes service."""
+        """Logic: Initializes service and a keep-alive HTTP session."""
         self.settings = settings
+        # Previews mostly come from one CDN; reuse connections across them
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Logic: Closes pooled HTTP connections."""
+        self._session.close()
 
     def save_metadata(
         self, base_file_path: str, metadata: Dict[str, Any], suffix: str = ""
@@ -31,11 +49,20 @@ class SidecarService:
         """
         base_name = os.path.splitext(base_file_path)[0]
         json_path = f"{base_name}{suffix}.json"
+        # Indent 2 on both paths: it is the only indent orjson supports
         try:
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=4, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(
+                    metadata,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+                with open(json_path, "wb") as f:
+                    f.write(data)
+            else:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, indent=2, ensure_ascii=False)
             logger.debug(f"Saved metadata: {json_path}")
-        except IOError as e:
+        except (IOError, TypeError) as e:
             logger.error(f"Failed to save sidecar {json_path}: {e}")
 
     def download_preview(self, base_file_path: str, image_url: str) -> None:
@@ -54,7 +81,7 @@ class SidecarService:
         if api_key and "civitai.com" in image_url:
             headers["Authorization"] = f"Bearer {api_key}"
         try:
-            with requests.get(
+            with self._session.get(
                 image_url, headers=headers, stream=True, timeout=15
             ) as r:
                 r.raise_for_status()
@@ -2,7 +2,8 @@
 Service to handle Base Model compatibility logic.
 """
 
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Dict, Literal, Optional
 
 CompatibilityStatus = Literal[
     "compatible", "possible", "incompatible", "unknown"
@@ -40,6 +41,9 @@ class CompatibilityService:
         "Pony": ["SDXL"],
         "Illustrious": ["SDXL"],
     }
+    _EXACT: Dict[str, str] = {
+        m: fam for fam, members in FAMILIES.items() for m in members
+    }
 
     @classmethod
     def get_family(cls, base_model_name: Optional[str]) -> str:
@@ -48,17 +52,7 @@ class CompatibilityService:
         Logic: Matches model name against known families."""
         if not base_model_name:
             return "Unknown"
-        name = base_model_name.strip()
-        for family, members in cls.FAMILIES.items():
-            if name in members or any((m in name for m in members)):
-                return family
-        if "SDXL" in name:
-            return "SDXL"
-        if "1.5" in name:
-            return "SD1"
-        if "Pony" in name:
-            return "Pony"
-        return "Unknown"
+        return _family_of(base_model_name)
 
     @classmethod
     def check(
@@ -74,15 +68,7 @@ class CompatibilityService:
             return "unknown"
         if model_base == resource_base:
             return "compatible"
-        model_fam = cls.get_family(model_base)
-        res_fam = cls.get_family(resource_base)
-        if model_fam == "Unknown" or res_fam == "Unknown":
-            return "unknown"
-        if model_fam == res_fam:
-            return "compatible"
-        if res_fam in cls.CROSS_COMPATIBILITY.get(model_fam, []):
-            return "possible"
-        return "incompatible"
+        return _check_pair(model_base, resource_base)
 
     @staticmethod
     def get_status_icon(status: CompatibilityStatus) -> str:
@@ -94,3 +80,38 @@ class CompatibilityService:
         if status == "unknown":
             return "❓"
         return "⛔"
+
+
+@lru_cache(maxsize=2048)
+def _check_pair(model_base: str, resource_base: str) -> CompatibilityStatus:
+    """Logic: Memoized family comparison for a (model, resource) pair;
+    list redraws re-check the same handful of pairs per row."""
+    model_fam = _family_of(model_base)
+    res_fam = _family_of(resource_base)
+    if model_fam == "Unknown" or res_fam == "Unknown":
+        return "unknown"
+    if model_fam == res_fam:
+        return "compatible"
+    if res_fam in CompatibilityService.CROSS_COMPATIBILITY.get(model_fam, []):
+        return "possible"
+    return "incompatible"
+
+
+@lru_cache(maxsize=512)
+def _family_of(base_model_name: str) -> str:
+    """Logic: Resolves exact members via a dict, then falls back to
+    substring matching; results are memoized per raw name."""
+    name = base_model_name.strip()
+    family = CompatibilityService._EXACT.get(name)
+    if family is not None:
+        return family
+    for family, members in CompatibilityService.FAMILIES.items():
+        if any((m in name for m in members)):
+            return family
+    if "SDXL" in name:
+        return "SDXL"
+    if "1.5" in name:
+        return "SD1"
+    if "Pony" in name:
+        return "Pony"
+    return "Unknown"
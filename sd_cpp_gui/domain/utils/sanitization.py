@@ -3,29 +3,46 @@ Utilities for string sanitization and filename normalization.
 """
 
 import os
-import re
+import string
+import sys
 import unicodedata
 import uuid
+from typing import Optional, Set
+
+# Platforms whose default filesystems ignore case. This only shapes the
+# snapshot keys; mounts can differ (e.g. vfat on Linux), so targets are
+# still confirmed on disk before anything is written.
+CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+# Characters kept verbatim; every other ASCII char (including "_" and
+# "-") maps to an underscore, and runs are then folded to one.
+_ALLOWED = frozenset(string.ascii_lowercase + string.digits + ".")
+_TRANS = str.maketrans(
+    {chr(i): "_" for i in range(128) if chr(i) not in _ALLOWED}
+)
 
 
 def make_filename_portable(filename: str, max_length: int = 64) -> str:
     """
     Converts a filename to a safe, portable, ASCII-only version.
-    1. NFKD normalization (splits characters from accents).
+    1. NFKD normalization (splits characters from accents); skipped
+       for names that are already pure ASCII.
     2. Encodes to ASCII, ignoring non-convertible chars (like emojis/kanji).
-    3. Replaces non-alphanumeric chars with underscores.
-    4. Collapses multiple underscores.
-    5. Truncates to max_length.
+    3. Replaces runs of non-alphanumeric chars with a single underscore.
+    4. Truncates to max_length.
 
-    Logic: Normalizes unicode, strips non-ascii/special chars, truncates,
-    and handles empty result.
+    Logic: Skips normalization for pure-ASCII names, strips
+    non-ascii/special chars, truncates, and handles empty result.
     """
     name, ext = os.path.splitext(filename)
-    nfkd_form = unicodedata.normalize("NFKD", name)
-    only_ascii = nfkd_form.encode("ASCII", "ignore").decode("ASCII")
-    clean_name = re.sub(r"[^a-zA-Z0-9\-\.]", "_", only_ascii)
-    clean_name = re.sub(r"[_\-]+", "_", clean_name)
-    clean_name = clean_name.lower()
+    if name.isascii():
+        only_ascii = name
+    else:
+        nfkd_form = unicodedata.normalize("NFKD", name)
+        only_ascii = nfkd_form.encode("ASCII", "ignore").decode("ASCII")
+    clean_name = only_ascii.lower().translate(_TRANS)
+    while "__" in clean_name:
+        clean_name = clean_name.replace("__", "_")
     if len(clean_name) > max_length:
         clean_name = clean_name[:max_length]
     clean_name = clean_name.strip("._-")
@@ -34,20 +51,52 @@ def make_filename_portable(filename: str, max_length: int = 64) -> str:
     return f"{clean_name}{ext.lower()}"
 
 
-def get_unique_filename(directory: str, filename: str) -> str:
+def fold_filename(name: str) -> str:
+    """
+    Returns the key under which the filesystem compares entry names:
+    casefolded on case-insensitive platforms, unchanged elsewhere.
+
+    Logic: Casefolds name when CASE_INSENSITIVE_FS applies.
+    """
+    return name.casefold() if CASE_INSENSITIVE_FS else name
+
+
+def get_unique_filename(
+    directory: str, filename: str, existing: Optional[Set[str]] = None
+) -> str:
     """
     Ensures the filename does not exist in the
     directory by appending _1, _2.
+    Callers renaming many files in one directory can pass their own
+    snapshot as `existing`; it must hold fold_filename() keys, and the
+    caller is then responsible for confirming the result on disk.
 
-    Logic: Appends counter to filename if it already exists in directory.
+    Logic: Snapshots directory entries once with scandir (or uses the
+    given snapshot), then appends a counter until the name is free,
+    comparing names by the filesystem's case rules. Without a caller
+    snapshot, the candidate is also checked with os.path.lexists.
     """
-    destination = os.path.join(directory, filename)
-    if not os.path.exists(destination):
+    confirm = existing is None
+    if existing is None:
+        try:
+            with os.scandir(directory) as it:
+                existing = {fold_filename(entry.name) for entry in it}
+        except OSError:
+            existing = set()
+
+    def _is_free(candidate: str) -> bool:
+        if fold_filename(candidate) in existing:
+            return False
+        return not (
+            confirm and os.path.lexists(os.path.join(directory, candidate))
+        )
+
+    if _is_free(filename):
         return filename
     name, ext = os.path.splitext(filename)
     counter = 1
     while True:
         new_name = f"{name}_{counter}{ext}"
-        if not os.path.exists(os.path.join(directory, new_name)):
+        if _is_free(new_name):
             return new_name
         counter += 1
@@ -1,4 +1,5 @@
 import threading
+from functools import cached_property
 from typing import Optional
 
 from sd_cpp_gui.data.db.history_manager import HistoryManager
@@ -25,15 +26,14 @@ class DependencyContainer:
 
     def __init__(self) -> None:
         """
-        Logic: Initializes all singleton managers, services, and
-        registers plugins.
+        Logic: Initializes the managers needed at launch and starts plugin
+        discovery in the background; history, queue and remote are built
+        on first access.
         """
         self.settings = SettingsManager()
         self.models = ModelManager()
         self.loras = LoraManager()
         self.embeddings = EmbeddingManager()
-        self.history = HistoryManager()
-        self.queue = QueueManager()
         self.cmd_loader = CommandLoader(COMMANDS_FILE)
         self.generation_state = GenerationState()
         self.arg_processor = ArgumentProcessor(self.cmd_loader, self.embeddings)
@@ -41,13 +41,39 @@ class DependencyContainer:
             self.cmd_loader, self.generation_state, self.arg_processor
         )
         self.execution_manager: Optional[ExecutionManager] = None
-        self.remote = RemoteManager(self.settings)
 
         self.autocomplete = AutocompleteService(AUTOCOMPLETE_FILE)
         threading.Thread(target=self.autocomplete.load, daemon=True).start()
 
         self.plugins = PluginManager(self)
-        self.plugins.discover_and_register("sd_cpp_gui.plugins")
+        self.plugins.discover_in_background("sd_cpp_gui.plugins")
+
+    @cached_property
+    def history(self) -> HistoryManager:
+        """Logic: Lazily creates the history manager."""
+        return HistoryManager()
+
+    @cached_property
+    def queue(self) -> QueueManager:
+        """Logic: Lazily creates the queue manager, which sanitizes stale
+        entries on first construction."""
+        return QueueManager()
+
+    @cached_property
+    def remote(self) -> RemoteManager:
+        """Logic: Lazily creates the remote manager and its HTTP sessions."""
+        return RemoteManager(self.settings)
+
+    def shutdown(self) -> None:
+        """
+        Releases resources held by the managers at application exit.
+
+        Logic: Closes the remote manager's HTTP sessions if it was built;
+        lazily created managers that were never accessed are skipped.
+        """
+        remote = self.__dict__.get("remote")
+        if remote is not None:
+            remote.close()
 
     def init_execution_manager(
         self, cli_runner: IGenerator, server_runner: IGenerator
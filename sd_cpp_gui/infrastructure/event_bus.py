@@ -4,7 +4,7 @@ Implements a decoupled Publish-Subscribe pattern.
 """
 
 import threading
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from sd_cpp_gui.infrastructure.logger import get_logger
 
@@ -17,7 +17,20 @@ class EventBus:
     """
 
     _subscribers: Dict[str, Dict[str, Callable[[Optional[Any]], None]]] = {}
-    _lock = threading.RLock()
+    _snapshot: Dict[
+        str, Tuple[Tuple[str, Callable[[Optional[Any]], None]], ...]
+    ] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _refresh_snapshot(cls, channel: str) -> None:
+        """Logic: Rebuilds the immutable listener tuple for a channel.
+        Must be called with the lock held."""
+        subs = cls._subscribers.get(channel)
+        if subs:
+            cls._snapshot[channel] = tuple(subs.items())
+        else:
+            cls._snapshot.pop(channel, None)
 
     @classmethod
     def subscribe(
@@ -42,6 +55,7 @@ class EventBus:
             if channel not in cls._subscribers:
                 cls._subscribers[channel] = {}
             cls._subscribers[channel][subscriber_id] = callback
+            cls._refresh_snapshot(channel)
 
     @classmethod
     def unsubscribe(cls, channel: str, subscriber_id: str) -> None:
@@ -54,18 +68,19 @@ class EventBus:
                     pass
                 if not cls._subscribers[channel]:
                     del cls._subscribers[channel]
+                cls._refresh_snapshot(channel)
 
     @classmethod
     def publish(cls, channel: str, payload: Optional[Any] = None) -> None:
         """
         Publishes an event to all subscribers of the channel.
 
-        Logic: Invokes all callbacks for the channel.
+        Logic: Invokes all callbacks for the channel from the immutable
+        snapshot tuple, so no copy or lock is needed per publish.
         """
-        with cls._lock:
-            if channel not in cls._subscribers:
-                return
-            listeners = list(cls._subscribers[channel].items())
+        listeners = cls._snapshot.get(channel)
+        if not listeners:
+            return
         for sub_id, callback in listeners:
             try:
                 callback(payload)
@@ -85,3 +100,4 @@ class EventBus:
         Logic: Clears all subscriptions."""
         with cls._lock:
             cls._subscribers.clear()
+            cls._snapshot.clear()
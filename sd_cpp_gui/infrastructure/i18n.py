@@ -3,6 +3,7 @@ Internationalization (i18n) manager.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, cast
 
@@ -11,6 +12,13 @@ from sd_cpp_gui.infrastructure.paths import LOCALES_DIR
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class I18nManager:
     """Manages application languages and translations."""
@@ -20,7 +28,11 @@ class I18nManager:
     ) -> None:
         """Logic: Initializes manager and loads default locale."""
         self.translations: Dict[str, str] = {}
+        # Bound lookup for hot call sites: i18n.t("key", "default").
+        # Rebound whenever a locale replaces the translations dict.
+        self.t = self.translations.get
         self.locales_dir = locales_dir
+        self._locales_cache: Optional[List[str]] = None
         # Note: Do not try to create locales_dir here, as it might
         # be read-only in _MEIPASS
         self.current_locale: str = default_locale
@@ -29,7 +41,8 @@ class I18nManager:
     def load_locale(self, locale_code: str) -> None:
         """Loads a JSON translation file.
 
-        Logic: Loads translation dict from JSON file."""
+        Logic: Loads translation dict from JSON file, parsing the raw bytes
+        with orjson when available."""
         path = self.locales_dir / f"{locale_code}.json"
 
         # Fallback logic
@@ -44,11 +57,17 @@ class I18nManager:
                     return
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                self.translations = cast(Dict[str, str], json.load(f))
+            with open(path, "rb") as f:
+                raw = f.read()
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw)
+            self.translations = cast(Dict[str, str], data)
+            self.t = self.translations.get
             self.current_locale = locale_code
             logger.info("Language loaded: %s", locale_code)
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, ValueError) as e:
             logger.error(
                 "Loading error for locale %s: %s", locale_code, e, exc_info=True
             )
@@ -57,27 +76,32 @@ class I18nManager:
         """
         Returns the translation for the key.
 
-        Logic: Returns translated string or default/key if missing.
+        Logic: Returns translated string or default/key if missing,
+        with a single dict lookup.
         """
-        if key not in self.translations:
-            # logger.warning('Translation key not found: "%s"', key)
-            pass
-        return self.translations.get(
-            key, default if default is not None else key
-        )
-
-    def get_locales(self) -> List[str]:
+        val = self.translations.get(key)
+        if val is not None:
+            return val
+        return default if default is not None else key
+
+    def get_locales(self, refresh: bool = False) -> List[str]:
         """Returns a list of available locales based on file existence.
+        The directory is listed once; pass refresh=True to re-scan.
 
-        Logic: Lists available json locale files."""
-        if not self.locales_dir.exists():
+        Logic: Lists available json locale files via a cached scandir."""
+        if self._locales_cache is not None and not refresh:
+            return list(self._locales_cache)
+        try:
+            with os.scandir(self.locales_dir) as it:
+                locales = [
+                    entry.name[:-5]
+                    for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except OSError:
             return ["en_US"]
-
-        return [
-            path.stem
-            for path in self.locales_dir.glob("*.json")
-            if path.is_file()
-        ]
+        self._locales_cache = locales
+        return list(locales)
 
 
 I18N_MANAGER = I18nManager(LOCALES_DIR)
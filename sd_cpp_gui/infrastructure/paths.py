@@ -62,7 +62,22 @@ LOGS_DIR = ROOT_DIR / "logs"
 
 OUTPUT_DIR = get_output_dir()
 
+
+def _ensure(path: Path) -> None:
+    """
+    Creates a directory if missing.
+    The common case (already exists) costs a single failed mkdir;
+    the recursive makedirs walk only runs when a parent is missing.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
 # Ensure writable directories exist
-os.makedirs(DATA_DIR, exist_ok=True)
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(LOGS_DIR, exist_ok=True)
+_ensure(DATA_DIR)
+_ensure(OUTPUT_DIR)
+_ensure(LOGS_DIR)
@@ -27,10 +27,19 @@ import sd_cpp_gui.ui.components.nine_slices as nine_slices
 from sd_cpp_gui.domain.generation.engine import SDRunner
 from sd_cpp_gui.domain.generation.server_backend import SDServerRunner
 from sd_cpp_gui.infrastructure.di_container import DependencyContainer
-from sd_cpp_gui.infrastructure.logger import setup_logging
+from sd_cpp_gui.infrastructure.logger import get_logger, setup_logging
 from sd_cpp_gui.infrastructure.paths import LOGS_DIR
 from sd_cpp_gui.ui.app import App
 
+logger = get_logger(__name__)
+
+_QUALITY_MAP = {
+    "Nearest": Image.Resampling.NEAREST,
+    "Bilinear": Image.Resampling.BILINEAR,
+    "Bicubic": Image.Resampling.BICUBIC,
+    "Lanczos": Image.Resampling.LANCZOS,
+}
+
 
 def main() -> None:
     """Initializes all managers and runs the application.
@@ -40,29 +49,28 @@ def main() -> None:
     try:
         setup_logging(log_file=LOGS_DIR / "sd_cpp_gui.log")
         container = DependencyContainer()
-        ui_scale_str = container.settings.get("ui_scale", "1")
+        startup = container.settings.get_many(
+            (
+                "ui_scale",
+                "ui_first_quality",
+                "ui_quality",
+                "executable",
+                "server_executable_path",
+            )
+        )
+        ui_scale_str = startup.get("ui_scale") or "1"
         if ui_scale_str and str(ui_scale_str).isdigit():
             nine_slices.GLOBAL_SCALE = int(ui_scale_str)
         else:
             nine_slices.GLOBAL_SCALE = 1
-        _quality_map = {
-            "Nearest": Image.Resampling.NEAREST,
-            "Bilinear": Image.Resampling.BILINEAR,
-            "Bicubic": Image.Resampling.BICUBIC,
-            "Lanczos": Image.Resampling.LANCZOS,
-        }
-        first_quality_str = container.settings.get(
-            "ui_first_quality", "Nearest"
-        )
-        if first_quality_str in _quality_map:
-            nine_slices.FIRST_RESAMPLING = _quality_map[first_quality_str]
-        last_quality_str = container.settings.get("ui_quality", "Bicubic")
-        if last_quality_str in _quality_map:
-            nine_slices.LAST_RESAMPLING = _quality_map[last_quality_str]
-        executable_path = container.settings.get_app()
-        server_executable_path = (
-            container.settings.get("server_executable_path", None) or ""
-        )
+        first_quality_str = startup.get("ui_first_quality") or "Nearest"
+        if first_quality_str in _QUALITY_MAP:
+            nine_slices.FIRST_RESAMPLING = _QUALITY_MAP[first_quality_str]
+        last_quality_str = startup.get("ui_quality") or "Bicubic"
+        if last_quality_str in _QUALITY_MAP:
+            nine_slices.LAST_RESAMPLING = _QUALITY_MAP[last_quality_str]
+        executable_path = str(startup.get("executable", "./sd"))
+        server_executable_path = startup.get("server_executable_path") or ""
         cli_runner = SDRunner(executable_path)
         server_runner = SDServerRunner(
             server_executable_path,
@@ -73,9 +81,7 @@ def main() -> None:
         app.place_window_center()
         app.mainloop()
     except Exception as e:
-        import logging
-
-        logging.exception(e)
+        logger.exception(e)
         import tkinter as tk
         from tkinter import messagebox
 
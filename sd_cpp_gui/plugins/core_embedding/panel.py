@@ -33,7 +33,7 @@ class EmbeddingSection(NetworkSection):
             editor_callback=lambda: NetworkEditor(  # type: ignore
                 self,
                 embedding_manager,
-                self.refresh_list,
+                self.schedule_refresh,
                 network_type="embedding",
             ),
             widget_class=EmbeddingWidget,
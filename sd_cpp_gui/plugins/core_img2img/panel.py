@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Optional, cast
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional, Tuple, cast
 
 import ttkbootstrap as ttk
 from PIL import Image, ImageTk
@@ -13,8 +16,6 @@ from sd_cpp_gui.ui.components import flat
 from sd_cpp_gui.ui.components.utils import CopyLabel
 
 if TYPE_CHECKING:
-    import tkinter as tk
-
     from sd_cpp_gui.domain.generation import StateManager
     from sd_cpp_gui.infrastructure.i18n import I18nManager
     from sd_cpp_gui.ui.controls.numeric_control import NumericControl
@@ -23,9 +24,14 @@ if TYPE_CHECKING:
 i18n: I18nManager = get_i18n()
 
 
+ThumbKey = Tuple[str, int, int]
+
+
 class Img2ImgSection(ttk.Frame):
     """Img2Img Section."""
 
+    _THUMB_CACHE_SIZE = 16
+
     def __init__(self, parent: tk.Widget, state_manager: StateManager) -> None:
         """Logic: Initializes Img2Img Section."""
         super().__init__(parent)
@@ -33,6 +39,17 @@ class Img2ImgSection(ttk.Frame):
         self.path_control: PathControl
         self.strength_control: NumericControl
         self.lbl_thumb: Optional[CopyLabel] = None
+        # Decode/resize runs off the Tk thread; only the latest request
+        # is applied to the label.
+        self._thumb_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="img2img-thumb"
+        )
+        self._thumb_future: Optional[Future[Image.Image]] = None
+        # PhotoImages are bound to this Tk root, so the cache is per
+        # instance. Keyed by (path, mtime_ns, size) to catch edits.
+        self._thumb_cache: OrderedDict[ThumbKey, ImageTk.PhotoImage] = (
+            OrderedDict()
+        )
         self._init_ui()
 
     @property
@@ -92,12 +109,17 @@ class Img2ImgSection(ttk.Frame):
     def _on_path_change(self, *_args: Any) -> None:
         """Logic: Handles path change."""
         path = self.path_control.var_value.get()
-        is_valid_path = path and os.path.exists(str(path))
-        if is_valid_path:
+        st: Optional[os.stat_result] = None
+        if path:
+            try:
+                st = os.stat(str(path))
+            except OSError:
+                st = None
+        if st is not None:
             if not self.strength_control.var_enabled.get():
                 self.strength_control.var_enabled.set(True)
                 self.strength_control.toggle_state()
-            self.update_thumb(str(path))
+            self.update_thumb(str(path), st)
         else:
             if self.strength_control.var_enabled.get():
                 self.strength_control.var_enabled.set(False)
@@ -109,20 +131,89 @@ class Img2ImgSection(ttk.Frame):
         self.path_control.set_value("")
 
     def clear_thumb(self) -> None:
-        """Logic: Clears thumbnail."""
+        """Logic: Drops any pending decode and clears thumbnail."""
+        self._cancel_thumb()
         if self.lbl_thumb and self.lbl_thumb.winfo_exists():
             self.lbl_thumb.configure(image="", text=i18n.get("img2img.no_img"))
             self.lbl_thumb.image = None  # type: ignore
 
-    def update_thumb(self, path: str) -> None:
-        """Logic: Updates thumbnail."""
+    def update_thumb(
+        self, path: str, st: Optional[os.stat_result] = None
+    ) -> None:
+        """Logic: Shows a cached thumbnail when the file is unchanged,
+        otherwise submits decode + resize to the worker thread; the result
+        is applied on the Tk thread if it is still the latest request.
+        Reuses the caller's stat result when given."""
         if not self.lbl_thumb or not self.lbl_thumb.winfo_exists():
             return
+        self._cancel_thumb()
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                self.clear_thumb()
+                return
+        key: ThumbKey = (path, st.st_mtime_ns, st.st_size)
+        cached = self._thumb_cache.get(key)
+        if cached is not None:
+            self._thumb_cache.move_to_end(key)
+            self._show_thumb(cached)
+            return
+        future = self._thumb_executor.submit(self._load_thumb, path)
+        self._thumb_future = future
+        future.add_done_callback(lambda f: self._schedule_apply_thumb(key, f))
+
+    @staticmethod
+    def _load_thumb(path: str) -> Image.Image:
+        """Logic: Decodes and downsizes the image (worker thread). draft()
+        lets JPEGs decode at a reduced scale; it is a no-op otherwise."""
+        with Image.open(path) as img:
+            img.draft("RGB", (384, 384))
+            img.thumbnail((384, 384), Image.Resampling.BILINEAR)
+            return img.copy()
+
+    def _schedule_apply_thumb(
+        self, key: ThumbKey, future: Future[Image.Image]
+    ) -> None:
+        """Logic: Hands a finished decode back to the Tk thread."""
+        if future.cancelled():
+            return
         try:
-            with Image.open(path) as img:
-                img.thumbnail((384, 384))
-                tk_img = ImageTk.PhotoImage(img)
-            self.lbl_thumb.configure(image=tk_img, text="")
-            self.lbl_thumb.image = tk_img  # type: ignore
+            self.after(0, self._apply_thumb, key, future)
+        except (RuntimeError, tk.TclError):
+            pass  # Widget or interpreter already gone
+
+    def _apply_thumb(self, key: ThumbKey, future: Future[Image.Image]) -> None:
+        """Logic: Builds the PhotoImage, caches it and updates the label
+        (Tk thread)."""
+        if future is not self._thumb_future:
+            return
+        self._thumb_future = None
+        if not self.lbl_thumb or not self.lbl_thumb.winfo_exists():
+            return
+        try:
+            tk_img = ImageTk.PhotoImage(future.result())
         except Exception:
             self.clear_thumb()
+            return
+        self._thumb_cache[key] = tk_img
+        if len(self._thumb_cache) > self._THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        self._show_thumb(tk_img)
+
+    def _show_thumb(self, tk_img: ImageTk.PhotoImage) -> None:
+        """Logic: Puts the thumbnail on the label."""
+        if self.lbl_thumb and self.lbl_thumb.winfo_exists():
+            self.lbl_thumb.configure(image=tk_img, text="")
+            self.lbl_thumb.image = tk_img  # type: ignore
+
+    def _cancel_thumb(self) -> None:
+        """Logic: Cancels a pending decode and forgets the running one."""
+        if self._thumb_future is not None:
+            self._thumb_future.cancel()
+            self._thumb_future = None
+
+    def destroy(self) -> None:
+        """Logic: Stops the thumbnail worker before destroying the frame."""
+        self._thumb_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
@@ -29,7 +29,7 @@ class LoraSection(NetworkSection):
             lora_manager,
             title="LoRA (Low-Rank Adaptation)",
             editor_callback=lambda: NetworkEditor(
-                self, lora_manager, self.refresh_list, network_type="lora"
+                self, lora_manager, self.schedule_refresh, network_type="lora"
             ),
             widget_class=LoraWidget,
             on_param_change=on_param_change,
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import queue
-from queue import SimpleQueue
-from typing import Any, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH, END
@@ -22,12 +21,21 @@ class LogConsole(ttk.Frame):
         "SYSTEM": "#c678dd",
         "PROGRESS": "#56b6c2",
     }
+    # Pending lines kept while the UI is not draining; oldest are dropped
+    MAX_PENDING = 10_000
+    # Poll delay (ms): reset on activity, doubled while idle up to the cap
+    POLL_MIN_MS = 50
+    POLL_MAX_MS = 500
 
     def __init__(self, parent: Any, **kwargs: Any) -> None:
         """Logic: Initializes console."""
         super().__init__(parent, **kwargs)
-        self.log_queue: SimpleQueue[Tuple[str, str]] = queue.SimpleQueue()
+        # deque append/popleft are atomic under the GIL; one producer side
+        # (any thread) and one consumer (the Tk poller) need no lock.
+        self.log_queue: Deque[Tuple[str, str]] = deque(maxlen=self.MAX_PENDING)
+        self._dropped = 0
         self._log_poll_id: Optional[str] = None
+        self._poll_delay = self.POLL_MIN_MS
         self.txt_widget = text.MText(
             self,
             bg_color="#1e1e1e",
@@ -50,8 +58,11 @@ class LogConsole(ttk.Frame):
         self.txt_widget.tag_config("DIM", foreground="#5c6370")
 
     def log(self, text: str, msg_type: str = "RAW") -> None:
-        """Logic: Logs text."""
-        self.log_queue.put((msg_type, text))
+        """Logic: Queues text; counts the oldest line as dropped when the
+        bounded queue is full."""
+        if len(self.log_queue) == self.MAX_PENDING:
+            self._dropped += 1
+        self.log_queue.append((msg_type, text))
 
     def clear(self) -> None:
         """Logic: Clears console."""
@@ -60,17 +71,37 @@ class LogConsole(ttk.Frame):
         self.txt_widget.configure(state="disabled")
 
     def _poll_log_queue(self) -> None:
-        """Logic: Polls log queue."""
-        if not self.log_queue.empty():
+        """Logic: Drains the queue, groups consecutive messages with the
+        same tag into runs and writes them with a single Text.insert.
+        Backs off while idle so an empty console rarely wakes Tk."""
+        msgs: List[Tuple[str, str]] = []
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            msgs.append(("SYSTEM", f"... {dropped} messages dropped"))
+        pending = self.log_queue
+        while pending:
+            msgs.append(pending.popleft())
+        if msgs:
+            # insert() takes alternating (chars, tag) pairs after the index
+            chunks: List[str] = []
+            run_tag = ""
+            run_buf: List[str] = []
+            for msg_type, text in msgs:
+                tag = msg_type if msg_type in self.COLORS else "RAW"
+                if tag != run_tag and run_buf:
+                    chunks += ("".join(run_buf), run_tag)
+                    run_buf = []
+                run_tag = tag
+                run_buf.append(text.rstrip() + "\n")
+            chunks += ("".join(run_buf), run_tag)
             self.txt_widget.configure(state="normal")
-            while not self.log_queue.empty():
-                try:
-                    msg_type, text = self.log_queue.get_nowait()
-                    tag = msg_type if msg_type in self.COLORS else "RAW"
-                    self.txt_widget.insert(END, text.rstrip() + "\n", tag)
-                except queue.Empty:
-                    break
+            self.txt_widget.insert(END, *chunks)
             self.txt_widget.see(END)
             self.txt_widget.configure(state="disabled")
+            self._poll_delay = self.POLL_MIN_MS
+        else:
+            self._poll_delay = min(self.POLL_MAX_MS, self._poll_delay * 2)
         if self.winfo_exists():
-            self._log_poll_id = self.after(100, self._poll_log_queue)
+            self._log_poll_id = self.after(
+                self._poll_delay, self._poll_log_queue
+            )
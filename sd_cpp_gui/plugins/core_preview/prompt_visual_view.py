@@ -177,7 +177,9 @@ class PromptVisualView(ttk.Frame):
     def on_show(self) -> None:
         """Logic: Setup listeners and load content."""
         if self.state_manager:
-            self.state_manager.add_listener(self._on_state_changed)
+            self.state_manager.add_listener(
+                self._on_state_changed, event_types=("prompt",)
+            )
             self._refresh_content()
 
     def on_hide(self) -> None:
@@ -4,12 +4,15 @@ Base class for Network Sections (LoRA/Embedding) with Selection Logic.
 
 from __future__ import annotations
 
+import threading
+import tkinter as tk
 from tkinter import filedialog
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
     cast,
@@ -21,6 +24,7 @@ from ttkbootstrap.constants import BOTH, HORIZONTAL, LEFT, RIGHT, X
 from sd_cpp_gui.constants import CORNER_RADIUS, SYSTEM_FONT
 from sd_cpp_gui.domain.utils.compatibility import CompatibilityService
 from sd_cpp_gui.infrastructure.i18n import get_i18n
+from sd_cpp_gui.infrastructure.logger import get_logger
 from sd_cpp_gui.plugins.shared_ui.network_picker import NetworkPickerDialog
 from sd_cpp_gui.plugins.shared_ui.network_widgets import GhostNetworkWidget
 from sd_cpp_gui.ui.components import flat
@@ -30,6 +34,7 @@ if TYPE_CHECKING:
     from sd_cpp_gui.infrastructure.i18n import I18nManager
 
 i18n: I18nManager = get_i18n()
+logger = get_logger(__name__)
 
 
 class NetworkSection(ttk.Frame):
@@ -38,6 +43,8 @@ class NetworkSection(ttk.Frame):
     Implements a 'Select & Add' workflow to keep the UI clean.
     """
 
+    REFRESH_DEBOUNCE_MS = 50
+
     def __init__(
         self,
         parent: ttk.Frame,
@@ -53,6 +60,10 @@ class NetworkSection(ttk.Frame):
         self.editor_callback = editor_callback
         self.on_param_change = on_param_change
         self.WidgetClass = widget_class
+        # Network kind fixed by the widget class; used for state keys
+        self._is_lora = widget_class.__name__ == "LoraWidget"
+        self._arg_type = "lora" if self._is_lora else "embedding"
+        self._state_key = self._arg_type + "s"
 
         self.var_add_triggers = ttk.BooleanVar(value=False)
         self.library_data: Dict[str, Dict[str, Any]] = {}
@@ -60,6 +71,8 @@ class NetworkSection(ttk.Frame):
         self.active_items: Dict[str, Tuple[ttk.Frame, Any]] = {}
 
         self.current_base_model: Optional[str] = None
+        self._scanning = False
+        self._refresh_pending: Optional[str] = None
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -112,6 +125,13 @@ class NetworkSection(ttk.Frame):
             command=self._import_folder,
         ).grid(row=0, column=2, padx=(5, 0))
 
+        # Shown only while a folder scan runs in the background
+        self.pb_scan = ttk.Progressbar(
+            f_folder, mode="indeterminate", bootstyle="info-striped"
+        )
+        self.pb_scan.grid(row=1, column=0, columnspan=3, sticky="ew", pady=2)
+        self.pb_scan.grid_remove()
+
         f_select = ttk.Frame(self.toolbar)
         f_select.pack(fill=X, pady=(5, 0))
         f_select.columnconfigure(0, weight=1)
@@ -165,12 +185,13 @@ class NetworkSection(ttk.Frame):
         """
         all_items = self.manager.get_all()
 
+        # check() is memoized per (model, resource) base pair
+        check = CompatibilityService.check
+        base_model = self.current_base_model
         valid_items = []
         for item in all_items:
             res_base = item.get("base_model")
-            status = CompatibilityService.check(
-                self.current_base_model, res_base
-            )
+            status = check(base_model, res_base)
 
             if status == "incompatible":
                 continue
@@ -194,17 +215,66 @@ class NetworkSection(ttk.Frame):
         picker.grab_set()
 
     def _import_folder(self) -> None:
-        """Opens folder dialog and imports networks from selected path."""
+        """Opens folder dialog and imports networks from selected path.
+        The scan runs on a worker thread so large libraries don't freeze
+        the UI; the lists refresh when it finishes."""
+        if self._scanning:
+            return
         folder = filedialog.askdirectory(parent=self)
-        if folder:
+        if not folder:
+            return
+        self._scanning = True
+        self.pb_scan.grid()
+        self.pb_scan.start(15)
+        threading.Thread(
+            target=self._scan_worker, args=(folder,), daemon=True
+        ).start()
+
+    def _scan_worker(self, folder: str) -> None:
+        """Imports the folder off the UI thread."""
+        count = 0
+        try:
             count = self.manager.scan_and_import_folder(folder)
-            if count > 0:
-                self.refresh_list()
-                self.cb_folders.set(folder)
-                self._on_folder_selected(None)
+        except Exception as e:
+            logger.error("Folder scan failed for %s: %s", folder, e)
+        try:
+            if self.winfo_exists():
+                self.after(0, self._on_scan_done, folder, count)
+        except (RuntimeError, tk.TclError):
+            pass  # Panel or interpreter destroyed during the scan
+
+    def _on_scan_done(self, folder: str, count: int) -> None:
+        """Hides the progress bar and shows the scanned folder."""
+        self._scanning = False
+        if not self.winfo_exists():
+            return
+        self.pb_scan.stop()
+        self.pb_scan.grid_remove()
+        if count > 0:
+            self.refresh_list()
+            self.cb_folders.set(folder)
+            self._on_folder_selected(None)
+
+    def schedule_refresh(self) -> None:
+        """Debounced refresh_list for the network editor's callback:
+        bursts of edits collapse into one rebuild after the last one."""
+        if self._refresh_pending is not None:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(
+            self.REFRESH_DEBOUNCE_MS, self._run_scheduled_refresh
+        )
+
+    def _run_scheduled_refresh(self) -> None:
+        """Runs a scheduled refresh unless the section is gone."""
+        self._refresh_pending = None
+        if self.winfo_exists():
+            self.refresh_list()
 
     def refresh_list(self) -> None:
-        """Refreshes the folder list and current library."""
+        """Refreshes the folder list and current library immediately."""
+        if self._refresh_pending is not None:
+            self.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
         folders = self.manager.get_known_folders()
         self.cb_folders["values"] = folders
         if folders:
@@ -242,38 +312,39 @@ class NetworkSection(ttk.Frame):
             self.cb_available.set("")
             return
 
-        compatible = []
-        possible = []
-        unknown = []
+        compatible: List[str] = []
+        possible: List[str] = []
+        unknown: List[str] = []
+        aliases: Dict[str, str] = {}
 
+        check = CompatibilityService.check
+        base_model = self.current_base_model
         for name, item in self.library_data.items():
             res_base = item.get("base_model")
 
-            status = CompatibilityService.check(
-                self.current_base_model, res_base
-            )
+            status = check(base_model, res_base)
 
             alias = item.get("alias") or item.get("name")
             if status == "compatible":
-                compatible.append(alias)
+                display = alias
+                compatible.append(display)
             elif status == "possible":
-                possible.append(f"⚠️ {alias} ({res_base})")
+                display = f"⚠️ {alias} ({res_base})"
+                possible.append(display)
             elif status == "unknown":
-                unknown.append(f"❓ {alias}")
+                display = f"❓ {alias}"
+                unknown.append(display)
+            else:
+                continue
+            aliases[display] = name
 
-        final_values = sorted(compatible) + sorted(possible) + sorted(unknown)
+        compatible.sort()
+        possible.sort()
+        unknown.sort()
+        final_values = compatible + possible + unknown
 
         self.cb_available["values"] = final_values
-        self.aliases = {}
-        for name, item in self.library_data.items():
-            raw_alias = item.get("alias") or item.get("name")
-            res_base = item.get("base_model", "Unknown")
-            if not raw_alias:
-                continue
-
-            self.aliases[raw_alias] = name
-            self.aliases[f"⚠️ {raw_alias} ({res_base})"] = name
-            self.aliases[f"❓ {raw_alias}"] = name
+        self.aliases = aliases
 
         if final_values:
             self.cb_available.set(
@@ -318,13 +389,8 @@ class NetworkSection(ttk.Frame):
         """Removes the item from the view and notifies state."""
         if name in self.active_items:
             container, _widget = self.active_items[name]
-            arg_type = (
-                "lora"
-                if self.WidgetClass.__name__ == "LoraWidget"
-                else "embedding"
-            )
             if self.on_param_change:
-                self.on_param_change(arg_type, name)
+                self.on_param_change(self._arg_type, name)
             container.destroy()
             del self.active_items[name]
 
@@ -349,12 +415,8 @@ class NetworkSection(ttk.Frame):
         Values are now (strength, dir, triggers) or (target, strength,
         dir, triggers).
         """
-        network_type = (
-            "loras"
-            if self.WidgetClass.__name__ == "LoraWidget"
-            else "embeddings"
-        )
-        active_networks = state.get(network_type, {})
+        active_networks = state.get(self._state_key, {})
+        is_lora = self._is_lora
 
         for name in list(self.active_items.keys()):
             if name not in active_networks:
@@ -371,7 +433,7 @@ class NetworkSection(ttk.Frame):
                 else:
                     ghost_data = {}
                     if isinstance(value, tuple) and len(value) > 1:
-                        if self.WidgetClass.__name__ == "LoraWidget":
+                        if is_lora:
                             ghost_data = {
                                 "strength": value[0],
                             }
@@ -393,14 +455,16 @@ class NetworkSection(ttk.Frame):
                 _, widget = self.active_items[name]
                 widget.update_remote(enabled=True, value=value)
 
+    def destroy(self) -> None:
+        """Cancels a scheduled refresh before destroying the section."""
+        if self._refresh_pending is not None:
+            self.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
+        super().destroy()
+
     def reset(self) -> None:
         """Resets all widgets (disables them, doesn't remove them)."""
         for name, (_, widget) in list(self.active_items.items()):
-            arg_type = (
-                "lora"
-                if self.WidgetClass.__name__ == "LoraWidget"
-                else "embedding"
-            )
             if self.on_param_change:
-                self.on_param_change(arg_type, name)
+                self.on_param_change(self._arg_type, name)
             widget.reset()
@@ -774,7 +774,7 @@ class AppCoordinator(ttk.Window):
         Cleanup and shutdown.
 
         Logic: Saves window state, persists settings, stops server,
-        and destroys window.
+        releases container resources and destroys window.
         """
         try:
             if (
@@ -793,6 +793,7 @@ class AppCoordinator(ttk.Window):
             self.generation_state.get_full_state().get("parameters", {})
         )
         ServerProcessManager().stop()
+        self.container.shutdown()
         self.quit()
 
     def _save_persistent_settings_now(self, parameters: Dict[str, Any]) -> None:
@@ -264,9 +264,10 @@ def create_sidebar_buttons(
         "preview",
     }
     if plugin_manager:
-        for p in plugin_manager.plugins_map.keys():
-            if p in reserved_list:
-                reserved.add(p)
+        for plugin in plugin_manager.get_active_plugins():
+            key = plugin.manifest.get("key")
+            if key in reserved_list:
+                reserved.add(key)
 
     for cat in categories:
         if cat not in reserved:
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sd_cpp_gui.domain.generation.states import StateManager
+from sd_cpp_gui.domain.generation.types import GenerationState
+
+
+def _fake_control(value, enabled=True):
+    """Minimal stand-in for a registered, live BaseArgumentControl."""
+    return SimpleNamespace(
+        is_overridden=False,
+        winfo_exists=lambda: True,
+        var_enabled=SimpleNamespace(get=lambda: enabled),
+        var_value=SimpleNamespace(get=lambda: value),
+    )
+
+
+def test_model_switch_keeps_persistent_parameters():
+    cmd_loader = MagicMock()
+    cmd_loader.get_by_internal_name.return_value = None
+    cmd_loader.get_all_flags.return_value = []
+    arg_processor = MagicMock()
+    arg_processor.get_persistent_flags.return_value = ["--threads"]
+    arg_processor.get_model_defaults.return_value = []
+
+    mgr = StateManager(cmd_loader, GenerationState(), arg_processor)
+    mgr.controls["--threads"] = [_fake_control(8)]
+    mgr.sync_all_controls(force=True)
+    assert mgr.state.parameters == {"--threads": 8}
+
+    mgr.configure_state_for_model({"id": "m"})
+
+    assert mgr.state.parameters == {"--threads": 8}